@@ -2,10 +2,14 @@
 from __future__ import annotations
 
 import json
+import re
 from collections.abc import Mapping, Sequence
-from typing import TYPE_CHECKING, TypeAlias
+from contextlib import suppress
+from typing import TYPE_CHECKING, TypeAlias, cast
 
+from hamcrest import anything
 from hamcrest.core.base_matcher import BaseMatcher
+from hamcrest.core.core.isanything import IsAnything
 from hamcrest.core.helpers.wrap_matcher import wrap_matcher
 
 if TYPE_CHECKING:
@@ -14,39 +18,256 @@ if TYPE_CHECKING:
 
 JsonObject: TypeAlias = Mapping[str, "JsonValue"]
 JsonValue: TypeAlias = str | int | float | bool | Sequence["JsonValue"] | JsonObject | None
+JsonPath: TypeAlias = tuple[str | int, ...]
+
+ANYTHING = anything()
+
+JSON_PATH_STEP = re.compile(r"""\.([^.\[]+)|\[(\d+)\]|\['([^']*)'\]|\["([^"]*)"\]""")
+JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+JSON_STRING = re.compile(r'"(?:[^"\\]|\\.)*"')
+JSON_SCALAR = re.compile(r"[^,:\]}\s]+")
+JSON_CONTAINER_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|[\[\]{}]')
+_decoder = json.JSONDecoder()
 
 
 class JsonMatching(BaseMatcher[str]):
     """Matches string containing JSON data.
 
+    Values at JSON paths can be matched too, with :meth:`with_json_path`. If only paths are to be matched, the
+    document isn't decoded as a whole - values which aren't on the way to a path are skipped over without being
+    decoded, and parsing stops as soon as every path has been found. (So a document which is invalid after that
+    point, or within a skipped value, may still match.)
+
     :param matcher: Value to match against deserialised JSON.
     """
 
-    def __init__(self, matcher: JsonValue | Matcher[JsonValue]) -> None:
+    def __init__(self, matcher: JsonValue | Matcher[JsonValue] = ANYTHING) -> None:
         self.matcher: Matcher[JsonValue] = wrap_matcher(matcher)
+        self.paths: dict[str, tuple[JsonPath, Matcher[JsonValue]]] = {}
 
     def describe_to(self, description: Description) -> None:
-        description.append_text("JSON structure matching ").append_description_of(self.matcher)
+        description.append_text("JSON structure")
+        if not isinstance(self.matcher, IsAnything):
+            description.append_text(" matching ").append_description_of(self.matcher)
+        for path, (_, matcher) in self.paths.items():
+            description.append_text(" with path ").append_description_of(path).append_text(" matching ")
+            description.append_description_of(matcher)
 
     def _matches(self, item: str) -> bool:
         try:
-            loads: JsonValue = json.loads(item)
+            loads = json.loads(item) if self._decodes_document else None
+            found = self._find_paths(item)
         except ValueError:
             return False
-        return self.matcher.matches(loads)
+        return self.matcher.matches(loads) and all(
+            steps in found and matcher.matches(found[steps]) for steps, matcher in self.paths.values()
+        )
+
+    @property
+    def _decodes_document(self) -> bool:
+        return not (self.paths and isinstance(self.matcher, IsAnything))
+
+    def _find_paths(self, item: str) -> dict[JsonPath, JsonValue]:
+        return extract_json_paths(item, [steps for steps, _ in self.paths.values()]) if self.paths else {}
 
     def describe_mismatch(self, item: str, mismatch_description: Description) -> None:
         try:
-            loads: JsonValue = json.loads(item)
+            loads: JsonValue = json.loads(item) if self._decodes_document else None
+            found = self._find_paths(item)
         except ValueError:
             mismatch_description.append_text("Got invalid JSON ").append_description_of(item)
         else:
-            self.matcher.describe_mismatch(loads, mismatch_description)
+            separator = ""
+            if not self.matcher.matches(loads):
+                self.matcher.describe_mismatch(loads, mismatch_description)
+                separator = ", "
+            self._describe_path_mismatches(found, mismatch_description, separator)
+
+    def _describe_path_mismatches(
+        self, found: dict[JsonPath, JsonValue], mismatch_description: Description, separator: str
+    ) -> None:
+        for path, (steps, matcher) in self.paths.items():
+            if steps not in found:
+                mismatch_description.append_text(f"{separator}path ").append_description_of(path)
+                mismatch_description.append_text(" missing")
+                separator = ", "
+            elif not matcher.matches(found[steps]):
+                mismatch_description.append_text(f"{separator}path ").append_description_of(path).append_text(" ")
+                matcher.describe_mismatch(found[steps], mismatch_description)
+                separator = ", "
+
+    def with_json_path(self, path: str, matcher: JsonValue | Matcher[JsonValue]) -> JsonMatching:
+        """Matches if the value at a JSON path matches the given value or matcher.
+
+        Can be called more than once, for different paths.
+
+        :param path: The JSON path, such as ``$.meta.total`` or ``$.items[0]['id']`` - a ``$``, followed by object
+                     members as ``.name``, ``['name']`` or ``["name"]``, and array elements as ``[index]``.
+        :param matcher: The expected value or matcher.
+        :return: Self, for chaining.
+        """
+        self.paths[path] = (parse_json_path(path), wrap_matcher(matcher))
+        return self
 
+    def and_json_path(self, path: str, matcher: JsonValue | Matcher[JsonValue]) -> JsonMatching:
+        """Matches if the value at a JSON path matches the given value or matcher.
 
-def json_matching(matcher: Matcher[JsonValue] | JsonValue) -> JsonMatching:
+        A synonym for :meth:`with_json_path`.
+
+        :param path: The JSON path.
+        :param matcher: The expected value or matcher.
+        :return: Self, for chaining.
+        """
+        return self.with_json_path(path, matcher)
+
+
+def json_matching(matcher: Matcher[JsonValue] | JsonValue = ANYTHING) -> JsonMatching:
     """Matches string containing JSON data.
 
     :param matcher: Value to match against deserialised JSON.
     """
     return JsonMatching(matcher)
+
+
+def parse_json_path(path: str) -> JsonPath:
+    """Parses a simple JSON path into its steps.
+
+    :param path: The JSON path, such as ``$.meta.total`` or ``$.items[0]['id']``.
+    :return: The object member names and array indices along the path.
+    :raises ValueError: If the path isn't valid.
+    """
+    if not path.startswith("$"):
+        msg = f"JSON path {path!r} must start with '$'"
+        raise ValueError(msg)
+    steps: list[str | int] = []
+    position = 1
+    while position < len(path):
+        step = JSON_PATH_STEP.match(path, position)
+        if not step:
+            msg = f"Invalid JSON path {path!r} at position {position}"
+            raise ValueError(msg)
+        name, index, single_quoted, double_quoted = step.groups()
+        steps.append(
+            int(index) if index is not None else next(s for s in (name, single_quoted, double_quoted) if s is not None)
+        )
+        position = step.end()
+    return tuple(steps)
+
+
+def extract_json_paths(document: str, paths: Sequence[JsonPath]) -> dict[JsonPath, JsonValue]:
+    """Finds the values at some JSON paths in a document, without decoding the rest of the document.
+
+    Only values on the way to a path are parsed - others are skipped over without being decoded - and parsing stops
+    as soon as every path has been found.
+
+    :param document: The JSON document.
+    :param paths: The paths, as returned by :func:`parse_json_path`.
+    :return: The values found, by path. Paths which aren't in the document are absent.
+    :raises ValueError: If the document isn't valid JSON on the way to the paths.
+    """
+    extractor = _JsonPathExtractor(document, paths)
+    with suppress(_AllPathsFound):
+        extractor.walk(0, ())
+    return extractor.found
+
+
+def _lookup(value: JsonValue, steps: JsonPath) -> JsonValue:
+    for step in steps:
+        if isinstance(step, int) and isinstance(value, list):
+            value = cast("list[JsonValue]", value)[step]
+        elif isinstance(step, str) and isinstance(value, dict):
+            value = cast("JsonObject", value)[step]
+        else:
+            raise TypeError(step)
+    return value
+
+
+class _AllPathsFound(Exception):  # noqa: N818 - not an error.
+    pass
+
+
+class _JsonPathExtractor:
+    def __init__(self, document: str, paths: Sequence[JsonPath]) -> None:
+        self.document = document
+        self.targets = set(paths)
+        self.prefixes = {path[:i] for path in paths for i in range(len(path))}
+        self.found: dict[JsonPath, JsonValue] = {}
+
+    def walk(self, position: int, path: JsonPath) -> int:
+        position = self._skip_whitespace(position)
+        if path in self.targets:
+            return self._take_value(position, path)
+        if path not in self.prefixes:
+            return self._skip_value(position)
+        if self.document.startswith("{", position):
+            return self._walk_object(position + 1, path)
+        if self.document.startswith("[", position):
+            return self._walk_array(position + 1, path)
+        return self._skip_value(position)
+
+    def _take_value(self, position: int, path: JsonPath) -> int:
+        self.found[path], end = _decoder.raw_decode(self.document, position)
+        for target in self.targets:
+            # Any targets within this one are looked up in its decoded value.
+            if len(target) > len(path) and target[: len(path)] == path:
+                with suppress(LookupError, TypeError):
+                    self.found[target] = _lookup(self.found[path], target[len(path) :])
+        if len(self.found) == len(self.targets):
+            raise _AllPathsFound
+        return end
+
+    def _walk_object(self, position: int, path: JsonPath) -> int:
+        position = self._skip_whitespace(position)
+        if self.document.startswith("}", position):
+            return position + 1
+        while True:
+            key, position = _decoder.raw_decode(self.document, self._skip_whitespace(position))
+            position = self._expect(position, ":")
+            position = self._skip_whitespace(self.walk(position, (*path, key)))
+            if self.document.startswith("}", position):
+                return position + 1
+            position = self._expect(position, ",")
+
+    def _walk_array(self, position: int, path: JsonPath) -> int:
+        position = self._skip_whitespace(position)
+        if self.document.startswith("]", position):
+            return position + 1
+        index = 0
+        while True:
+            position = self._skip_whitespace(self.walk(position, (*path, index)))
+            if self.document.startswith("]", position):
+                return position + 1
+            position = self._expect(position, ",")
+            index += 1
+
+    def _skip_value(self, position: int) -> int:
+        # Uses regular expressions to find the end of a value, rather than decoding it.
+        if self.document.startswith(("{", "["), position):
+            return self._skip_container(position)
+        value = JSON_STRING.match(self.document, position) or JSON_SCALAR.match(self.document, position)
+        if not value:
+            msg = f"Expecting JSON value at position {position}"
+            raise ValueError(msg)
+        return value.end()
+
+    def _skip_container(self, position: int) -> int:
+        depth = 0
+        for token in JSON_CONTAINER_TOKEN.finditer(self.document, position):
+            if token.group() in "[{":
+                depth += 1
+            elif token.group() in "]}":
+                depth -= 1
+                if depth == 0:
+                    return token.end()
+        msg = "Unterminated JSON container"
+        raise ValueError(msg)
+
+    def _skip_whitespace(self, position: int) -> int:
+        return cast("re.Match[str]", JSON_WHITESPACE.match(self.document, position)).end()
+
+    def _expect(self, position: int, delimiter: str) -> int:
+        position = self._skip_whitespace(position)
+        if not self.document.startswith(delimiter, position):
+            msg = f"Expecting {delimiter!r} at position {position}"
+            raise ValueError(msg)
+        return position + 1
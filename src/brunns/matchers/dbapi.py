@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import logging
+import time
+from contextlib import closing
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -9,27 +11,41 @@ from typing import (
     cast,
 )
 
-from hamcrest import anything, described_as
+from hamcrest import anything, contains_exactly, described_as, has_item, has_properties
 from hamcrest.core.base_matcher import BaseMatcher
+from hamcrest.library.collection.issequence_containing import IsSequenceContaining
 
 from brunns.row.rowwrapper import RowWrapper
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator, Sequence
 
     from hamcrest.core.description import Description
     from hamcrest.core.matcher import Matcher
 
 logger = logging.getLogger(__name__)
 
+ANYTHING = anything()
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_MAX_DESCRIBED_ROWS = 100
+
+# Row matchers which only need to see rows until they find a match, so can be given rows as they're fetched.
+STREAMING_MATCHERS = (IsSequenceContaining,)
+
 
 class Cursor(Protocol):
     def fetchall(self) -> Iterable[tuple[Any, ...]]:  # pragma: no cover
         ...
 
+    def fetchmany(self, size: int) -> Sequence[tuple[Any, ...]]:  # pragma: no cover
+        ...
+
     def execute(self, statement: str):  # pragma: no cover
         ...
 
+    def close(self) -> None:  # pragma: no cover
+        ...
+
     @property
     def description(self) -> tuple[tuple[str, str]] | None:  # pragma: no cover
         ...
@@ -40,46 +56,118 @@ class Connection(Protocol):
         ...
 
 
+class _QueryResult:
+    """A statement's rows, as fetched to be matched, kept - up to a maximum - to describe a mismatch with.
+
+    Times how long executing the statement and fetching its rows takes, excluding the time spent matching.
+    """
+
+    def __init__(self, conn: Connection, max_rows: int) -> None:
+        self.conn = conn
+        self.max_rows = max_rows
+        self.rows: list[Any] = []
+        self.row_count = 0
+        self.elapsed = 0.0
+        self.error: Exception | None = None
+
+    def execute(self, cursor: Cursor, select: str) -> None:
+        start = time.perf_counter()
+        try:
+            cursor.execute(select)
+        finally:
+            self.elapsed += time.perf_counter() - start
+
+    def fetch(self, cursor: Cursor, batch_size: int) -> Iterator[Any]:
+        wrapper = RowWrapper(cast("Any", cursor.description or ()))
+        while batch := self._fetchmany(cursor, batch_size):
+            for row in batch:
+                wrapped = wrapper.wrap(row)
+                self.row_count += 1
+                if len(self.rows) < self.max_rows:
+                    self.rows.append(wrapped)
+                yield wrapped
+
+    def _fetchmany(self, cursor: Cursor, batch_size: int) -> Sequence[tuple[Any, ...]]:
+        start = time.perf_counter()
+        try:
+            return cursor.fetchmany(batch_size)
+        finally:
+            self.elapsed += time.perf_counter() - start
+
+
 class SelectReturnsRowsMatching(BaseMatcher[Connection]):
-    def __init__(self, select: str, row_matcher: Matcher[list[Any]]) -> None:
+    """Matches if a select statement returns rows matching.
+
+    Where the row matcher can stop early given an iterator - :func:`hamcrest.has_item`, say - rows are streamed to it,
+    fetched ``batch_size`` at a time and wrapped only as they're reached, and fetching stops at the first match. Other
+    row matchers, such as :func:`hamcrest.contains_exactly` or :func:`hamcrest.has_length`, are given a list of all
+    the rows.
+
+    A mismatch is described from the rows fetched to be matched, rather than by running the statement again, so
+    describes the very rows which failed to match. Where rows are streamed, only the first ``max_described_rows`` are
+    kept for this.
+    """
+
+    def __init__(
+        self,
+        select: str,
+        row_matcher: Matcher[list[Any]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_described_rows: int = DEFAULT_MAX_DESCRIBED_ROWS,
+    ) -> None:
         self.select = select
         self.row_matcher = row_matcher
+        self.batch_size = batch_size
+        self.max_described_rows = max_described_rows
+        self._result: _QueryResult | None = None
 
     def _matches(self, item: Connection) -> bool:
+        streaming = isinstance(self.row_matcher, STREAMING_MATCHERS)
+        # A non-streaming row matcher is given - and its mismatch described with - the list of all the rows, so no
+        # more need be kept as they're fetched.
+        result = self._result = _QueryResult(item, self.max_described_rows if streaming else 0)
         try:
-            rows = self._get_rows(item, self.select)
-            return self.row_matcher.matches(rows)
-        except Exception:
+            with closing(item.cursor()) as cursor:
+                result.execute(cursor, self.select)
+                rows = result.fetch(cursor, self.batch_size)
+                if streaming:
+                    return self.row_matcher.matches(cast("Any", rows))
+                result.rows = list(rows)
+                return self.row_matcher.matches(result.rows)
+        except Exception as e:
+            result.error = e
             return False
 
-    @staticmethod
-    def _get_rows(conn: Connection, select: str):
-        cursor = conn.cursor()
-        cursor.execute(select)
-        wrapper = RowWrapper(cast("Any", cursor.description or ()))
-        return [wrapper.wrap(row) for row in cursor.fetchall()]
-
     def describe_to(self, description: Description) -> None:
         description.append_text("DB connection for which statement ").append_description_of(self.select).append_text(
             " returns rows matching ",
         ).append_description_of(self.row_matcher)
 
     def describe_mismatch(self, item: Connection, mismatch_description: Description) -> None:
-        try:
-            rows = self._get_rows(item, self.select)
-            self.row_matcher.describe_mismatch(rows, mismatch_description)
-        except Exception as e:
+        if self._result is None or self._result.conn is not item:
+            self._matches(item)
+        result = cast("_QueryResult", self._result)
+        if result.error:
             mismatch_description.append_text("SQL statement ").append_description_of(self.select).append_text(
                 " gives ",
-            ).append_description_of(type(e).__name__).append_text(" ").append_description_of(e)
+            ).append_description_of(type(result.error).__name__).append_text(" ").append_description_of(result.error)
+            mismatch_description.append_text(f" (after {result.elapsed:.3f}s)")
+        else:
+            self.row_matcher.describe_mismatch(result.rows, mismatch_description)
+            mismatch_description.append_text(f" ({result.row_count} rows in {result.elapsed:.3f}s")
+            if result.row_count > len(result.rows):
+                mismatch_description.append_text(f", first {len(result.rows)} described")
+            mismatch_description.append_text(")")
 
 
 def has_table(table: str) -> Matcher[Connection]:
     """Matches if database has table with name.
 
+    Selects no rows, so the table's size doesn't matter.
+
     :param table: Table name.
     """
-    select = f"SELECT * FROM {table};"  # nosec
+    select = f"SELECT * FROM {table} WHERE 1 = 0;"  # nosec
     return described_as(
         "DB connection has table named %0",
         given_select_returns_rows_matching(select, anything()),
@@ -87,6 +175,44 @@ def has_table(table: str) -> Matcher[Connection]:
     )
 
 
+def table_has_row_count(table: str, count: int | Matcher[int]) -> Matcher[Connection]:
+    """Matches if database has table with a number of rows matching.
+
+    The rows are counted by the database, rather than fetched.
+
+    :param table: Table name.
+    :param count: Expected number of rows, or matcher.
+    """
+    select = f"SELECT COUNT(*) AS row_count FROM {table};"  # nosec
+    return described_as(
+        "DB connection with table %0 with row count matching %1",
+        given_select_returns_rows_matching(
+            select, cast("Matcher[list[Any]]", contains_exactly(has_properties(row_count=count)))
+        ),
+        table,
+        count,
+    )
+
+
+def table_has_row_where(table: str, predicate: str, row_matcher: Matcher[Any] = ANYTHING) -> Matcher[Connection]:
+    """Matches if database has table with a row for which an SQL predicate holds, and which matches.
+
+    The rows are filtered by the database, so only rows for which the predicate holds are fetched.
+
+    :param table: Table name.
+    :param predicate: SQL boolean expression, as for a ``WHERE`` clause - e.g. ``"rating > 5"``.
+    :param row_matcher: Row matcher.
+    """
+    select = f"SELECT * FROM {table} WHERE {predicate};"  # nosec
+    return described_as(
+        "DB connection with table %0 with row where %1 matching %2",
+        given_select_returns_rows_matching(select, cast("Matcher[list[Any]]", has_item(row_matcher))),
+        table,
+        predicate,
+        row_matcher,
+    )
+
+
 def has_table_with_rows(table: str, row_matcher: Matcher[list[Any]]) -> Matcher[Connection]:
     """Matches if database has table with rows matching.
 
@@ -102,5 +228,10 @@ def has_table_with_rows(table: str, row_matcher: Matcher[list[Any]]) -> Matcher[
     )
 
 
-def given_select_returns_rows_matching(select: str, row_matcher: Matcher[list[Any]]) -> SelectReturnsRowsMatching:
-    return SelectReturnsRowsMatching(select, row_matcher)
+def given_select_returns_rows_matching(
+    select: str,
+    row_matcher: Matcher[list[Any]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_described_rows: int = DEFAULT_MAX_DESCRIBED_ROWS,
+) -> SelectReturnsRowsMatching:
+    return SelectReturnsRowsMatching(select, row_matcher, batch_size, max_described_rows)
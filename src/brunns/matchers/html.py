@@ -1,20 +1,113 @@
 # Copyright 2018-2026 Simon Brunning
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
-from typing import TYPE_CHECKING, Any, cast
+import logging
+from collections.abc import Iterator, Mapping, Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
+import soupsieve
 from bs4 import BeautifulSoup, Tag
+from bs4.builder import builder_registry
 from hamcrest import all_of, anything, contains_exactly, has_entry, has_item
 from hamcrest.core.base_matcher import BaseMatcher
 from hamcrest.core.helpers.wrap_matcher import wrap_matcher
 from hamcrest.core.matcher import Matcher
 
+from brunns.matchers.utils import LruCache
+
 if TYPE_CHECKING:
     from hamcrest.core.description import Description
 
+logger = logging.getLogger(__name__)
+
 ANYTHING = anything()
 ATTR_MATCHER = Matcher[Mapping[str, str | Matcher[str]]] | Mapping[str, str | Matcher[str]]
+DEFAULT_DOCUMENT_CACHE_SIZE = 32
+DEFAULT_PARSER = "html.parser"
+SELECTOR_CACHE_SIZE = 256
+
+
+class DocumentCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _TableModel:
+    """A table's rows, each with its data cells or header cells, extracted once."""
+
+    def __init__(self, table: Tag) -> None:
+        self.table = table
+        rows = [(row, row.find_all("td"), row.find_all("th")) for row in table.find_all("tr")]
+        self.data_rows = tuple((row, cells) for row, cells, _ in rows if cells)
+        self.header_rows = tuple((row, headers) for row, _, headers in rows if headers)
+
+
+class _DocumentCache:
+    """LRU cache of parsed HTML documents, keyed by the HTML string, shared by all the matchers in this module.
+
+    The matchers here never modify the parsed documents, so one parse can serve every matcher applied to a page.
+    Tables' extracted rows are kept alongside, likewise bounded, so several row matchers can share them.
+    """
+
+    def __init__(self, maxsize: int, parser: str) -> None:
+        self.maxsize = maxsize
+        self.parser = parser
+        self._documents: LruCache[str, BeautifulSoup] = LruCache(maxsize)
+        self._tables: LruCache[int, _TableModel] = LruCache(maxsize)
+
+    def get(self, html: str) -> BeautifulSoup:
+        document = self._documents.get(html)
+        if document is not None:
+            self._documents.count_hit()
+            return document
+
+        self._documents.count_miss()
+        document = BeautifulSoup(html, self.parser)
+        self._documents.put(html, document)
+        return document
+
+    def table(self, table: Tag) -> _TableModel:
+        # Keyed by identity - hashing a Tag serialises it. Holding the Tag stops its id being reused.
+        model = self._tables.get(id(table))
+        if model is not None and model.table is table:
+            return model
+
+        model = _TableModel(table)
+        self._tables.put(id(table), model)
+        return model
+
+    def use_parser(self, parser: str) -> None:
+        if parser != self.parser:
+            self.parser = parser
+            self._documents.clear(reset_counts=False)
+            self._tables.clear(reset_counts=False)
+
+    def resize(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._documents.resize(maxsize)
+        self._tables.resize(maxsize)
+
+    def clear(self) -> None:
+        self._documents.clear()
+        self._tables.clear()
+
+    def info(self) -> DocumentCacheInfo:
+        return DocumentCacheInfo(self._documents.hits, self._documents.misses, self.maxsize, len(self._documents))
+
+
+_document_cache = _DocumentCache(DEFAULT_DOCUMENT_CACHE_SIZE, DEFAULT_PARSER)
+
+
+def _parse(html: str) -> BeautifulSoup:
+    return _document_cache.get(html)
+
+
+@lru_cache(maxsize=SELECTOR_CACHE_SIZE)
+def _compile_selector(selector: str) -> soupsieve.SoupSieve:
+    return soupsieve.compile(selector)
 
 
 class HtmlWithTag(BaseMatcher[str]):
@@ -23,20 +116,37 @@ class HtmlWithTag(BaseMatcher[str]):
         tag_matcher: str | Matcher[Tag],
         name: str | None = None,
         id_: str | None = None,
+        selector: str | None = None,
     ) -> None:
         self.name = name
         self.id_ = id_
+        self.selector = selector
+        self._compiled_selector = _compile_selector(selector) if selector else None
         self.tag_matcher: Matcher[Tag] = (
             tag_matcher if isinstance(tag_matcher, Matcher) else tag_has_string(cast("str", tag_matcher))
         )
 
     def _matches(self, item: str) -> bool:
-        found_tags: Sequence[Tag] = self.findall(item)
-        return cast("Matcher[Sequence[Tag]]", has_item(self.tag_matcher)).matches(found_tags)
+        return any(self.tag_matcher.matches(tag) for tag in self.iterfind(item))
 
     def findall(self, actual: str) -> Sequence[Tag]:
-        soup = actual if isinstance(actual, Tag) else BeautifulSoup(actual, "html.parser")
-        return soup.find_all(self.name, id=self.id_) if self.id_ else soup.find_all(self.name)
+        return list(self.iterfind(actual))
+
+    def iterfind(self, actual: str) -> Iterator[Tag]:
+        """Yields the tags with the required name, id and selector in document order, one at a time.
+
+        Matching stops at the first tag which satisfies the tag matcher, so there's no need to collect every
+        candidate tag in a large document first.
+        """
+        soup = actual if isinstance(actual, Tag) else _parse(actual)
+        elements = self._compiled_selector.iselect(soup) if self._compiled_selector else soup.descendants
+        for element in elements:
+            if (
+                isinstance(element, Tag)
+                and (not self.name or element.name == self.name)
+                and (not self.id_ or element.get("id") == self.id_)
+            ):
+                yield element
 
     def describe_to(self, description: Description) -> None:
         description.append_text("HTML with tag")
@@ -44,6 +154,8 @@ class HtmlWithTag(BaseMatcher[str]):
             description.append_text(" name=").append_description_of(self.name)
         if self.id_:
             description.append_text(" id=").append_description_of(self.id_)
+        if self.selector:
+            description.append_text(" selector=").append_description_of(self.selector)
         description.append_text(" matching ").append_description_of(self.tag_matcher)
 
     def describe_mismatch(self, item: str, mismatch_description: Description) -> None:
@@ -52,6 +164,8 @@ class HtmlWithTag(BaseMatcher[str]):
             mismatch_description.append_text(" name=").append_description_of(self.name)
         if self.id_:
             mismatch_description.append_text(" id=").append_description_of(self.id_)
+        if self.selector:
+            mismatch_description.append_text(" selector=").append_description_of(self.selector)
         found = self.findall(item)
         mismatch_description.append_list(" values [", ", ", "]", [repr(t) for t in found])
 
@@ -95,7 +209,7 @@ class HtmlHasTable(BaseMatcher[str]):
         self.id_: Matcher[str] = wrap_matcher(id_)
 
     def _matches(self, item: str) -> bool:
-        tables = BeautifulSoup(item, "html.parser").find_all("table")
+        tables = _parse(item).find_all("table")
         return contains_exactly(all_of(cast("Matcher[Tag]", self.id_), self.table_matcher)).matches(
             cast("list[Tag]", tables)
         )
@@ -120,17 +234,12 @@ class TableHasRow(BaseMatcher[Tag]):
         self.index_matcher: Matcher[int] = wrap_matcher(index_matcher)
 
     def _matches(self, item: Tag) -> bool:
-        rows: Sequence[Tag] = item.find_all("tr")
-        rows_and_cells = [(row, self._row_cells(row)) for row in rows if self._row_cells(row)]
-        indexed_rows_and_cells = [(index, row, cells) for index, (row, cells) in enumerate(rows_and_cells)]
-        indexed_row_matcher = cast(
-            "Matcher[tuple[int, Tag, Sequence[Tag]]]",
-            contains_exactly(self.index_matcher, self.row_matcher, self.cells_matcher),  # pyright: ignore[reportArgumentType]
+        table = _document_cache.table(item)
+        rows_and_cells = table.header_rows if self.header_row else table.data_rows
+        return any(
+            self.index_matcher.matches(index) and self.row_matcher.matches(row) and self.cells_matcher.matches(cells)
+            for index, (row, cells) in enumerate(rows_and_cells)
         )
-        return has_item(indexed_row_matcher).matches(indexed_rows_and_cells)
-
-    def _row_cells(self, row: Tag) -> Sequence[Tag]:
-        return row.find_all("th" if self.header_row else "td")
 
     def describe_to(self, description: Description) -> None:
         description.append_text(f"table with {'header ' if self.header_row else ''}row")
@@ -181,6 +290,20 @@ def has_id_tag(id_, matcher) -> HtmlWithTag:
     return HtmlWithTag(matcher, id_=id_)
 
 
+def has_selector(selector: str, matcher: str | Matcher[Tag] = ANYTHING) -> HtmlWithTag:
+    """Matches HTML containing a tag selected by a CSS selector that satisfies a matcher.
+
+    For example, ``has_selector("div.card > a[href]", has_class("primary"))``. The selector is compiled once, and
+    compiled selectors are cached, so building many matchers with the same selector is cheap.
+
+    Requires brunns-matchers to have been installed with the ``html`` extra.
+
+    :param selector: The CSS selector used to find tags.
+    :param matcher: A matcher to apply to the selected tag(s). Matches any selected tag if omitted.
+    """
+    return HtmlWithTag(matcher, selector=selector)
+
+
 def tag_has_string(matcher: str | Matcher[str]) -> TagWith:
     """Matches a BeautifulSoup Tag if its text content matches the given criteria.
 
@@ -299,3 +422,46 @@ def has_image(
     src_matcher: ATTR_MATCHER = has_entry("src", src) if src != ANYTHING else ANYTHING
     id_matcher: ATTR_MATCHER = has_entry("id", id_) if id_ != ANYTHING else ANYTHING
     return HtmlWithTag(TagWith(name="img", clazz=clazz, attributes=all_of(src_matcher, id_matcher)))
+
+
+def set_parser(*parsers: str) -> str:
+    """Selects the BeautifulSoup parser used by the matchers in this module.
+
+    Parsers are tried in the order given, and the first one that's installed is used, falling back to Python's
+    built-in ``"html.parser"`` if none are. For example, ``set_parser("lxml")`` uses the much faster
+    `lxml <https://lxml.de/>`_ parser where it's available. Call with no arguments to restore the default.
+
+    Requires brunns-matchers to have been installed with the ``html`` extra.
+
+    :param parsers: BeautifulSoup parser names (or features), in order of preference.
+    :return: The name of the parser selected.
+    """
+    parser = next((parser for parser in parsers if builder_registry.lookup(parser)), DEFAULT_PARSER)
+    if parsers and parser not in parsers:
+        logger.warning("None of parsers %s installed - falling back to %r", parsers, parser)
+    _document_cache.use_parser(parser)
+    return parser
+
+
+def set_document_cache_size(maxsize: int) -> None:
+    """Sets how many parsed HTML documents are kept for reuse by the matchers in this module.
+
+    Parsed documents are cached by HTML string, so that several matchers applied to the same page parse it only
+    once. Set to ``0`` to disable caching. Shrinking the cache evicts the least recently used documents.
+
+    :param maxsize: The maximum number of parsed documents to keep.
+    """
+    _document_cache.resize(maxsize)
+
+
+def clear_document_cache() -> None:
+    """Discards all cached parsed HTML documents and table rows, and resets the cache statistics."""
+    _document_cache.clear()
+
+
+def document_cache_info() -> DocumentCacheInfo:
+    """Reports parsed HTML document cache statistics.
+
+    :return: A named tuple of ``hits``, ``misses``, ``maxsize`` and ``currsize``.
+    """
+    return _document_cache.info()
@@ -1,23 +1,37 @@
 # Copyright 2018-2026 Simon Brunning
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Protocol, TypeVar, cast, runtime_checkable
+import asyncio
+import hashlib
+import inspect
+import math
+import re
+import time
+from collections.abc import AsyncIterable
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Generic, NamedTuple, Protocol, TypeAlias, TypeVar, cast, runtime_checkable
 
 from deprecated import deprecated
-from hamcrest import anything, described_as, has_entry
+from hamcrest import anything, assert_that, described_as, has_entry
 from hamcrest.core.base_matcher import BaseMatcher
+from hamcrest.core.core.isanything import IsAnything
 from hamcrest.core.helpers.wrap_matcher import wrap_matcher
 from hamcrest.core.string_description import StringDescription
 
+from brunns.matchers.data import JsonMatching
 from brunns.matchers.object import between
 from brunns.matchers.utils import (
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_TIMEOUT,
     append_matcher_description,
     describe_field_match,
     describe_field_mismatch,
+    gather_bounded,
+    raise_batch_mismatches,
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Awaitable, Iterable, Iterator, Mapping, Sequence
     from datetime import timedelta
 
     from hamcrest.core.description import Description
@@ -58,6 +72,10 @@ R = TypeVar("R", bound=ResponseProtocol)
 
 ANYTHING = anything()
 
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DEFAULT_MAX_MATCH_LENGTH = 64 * 1024
+DEFAULT_HASH_ALGORITHM = "sha256"
+
 
 def is_response() -> ResponseMatcher:
     """Matches an HTTP response object (requests, httpx, etc.).
@@ -70,6 +88,89 @@ def is_response() -> ResponseMatcher:
     return ResponseMatcher()
 
 
+class _EvaluatedResponse(Generic[R]):
+    """A response's fields, each read from the underlying response at most once.
+
+    Shared between ``_matches()``, ``describe_mismatch()`` and ``describe_match()`` so that a single
+    assertion doesn't re-read or re-decode a large body.
+    """
+
+    def __init__(self, response: R) -> None:
+        self.response = response
+
+    @cached_property
+    def status_code(self) -> int:
+        return self.response.status_code
+
+    @cached_property
+    def text(self) -> str:
+        return self.response.text
+
+    @cached_property
+    def content(self) -> bytes:
+        return self.response.content
+
+    @cached_property
+    def json(self) -> JsonValue:
+        try:
+            return self.response.json()
+        except (ValueError, AttributeError, TypeError):
+            return None
+
+    @cached_property
+    def headers(self) -> Mapping[str, str]:
+        return self.response.headers
+
+    @cached_property
+    def cookies(self) -> Mapping[str, str]:
+        return self.response.cookies
+
+    @cached_property
+    def elapsed(self) -> timedelta:
+        return self.response.elapsed
+
+    @cached_property
+    def history(self) -> Sequence[ResponseProtocol]:
+        return self.response.history
+
+    @cached_property
+    def url(self) -> Any:
+        return self.response.url
+
+    @cached_property
+    def encoding(self) -> str | None:
+        return self.response.encoding
+
+
+class _Field(NamedTuple):
+    matcher: str  # The ResponseMatcher attribute holding the field's matcher.
+    description: str
+    value: str  # The _EvaluatedResponse attribute holding the field's value.
+    cost: int  # The relative cost of reading the value.
+
+
+# In the order they're described.
+_FIELDS = (
+    _Field("status_code", "status code", "status_code", 0),
+    _Field("body", "body", "text", 8),
+    _Field("content", "content", "content", 7),
+    _Field("json", "json", "json", 9),
+    _Field("json_paths", "json paths", "text", 8),
+    _Field("headers", "headers", "headers", 2),
+    _Field("cookies", "cookies", "cookies", 5),
+    _Field("elapsed", "elapsed", "elapsed", 0),
+    _Field("history", "history", "history", 6),
+    _Field("url", "url", "url", 3),
+    _Field("encoding", "encoding", "encoding", 1),
+)
+_BODY_FIELDS = frozenset({"body", "content", "json", "json_paths"})
+# Only worth describing if nothing cheaper has mismatched.
+_DECODED_FIELDS = frozenset({"json"})
+# Matched cheapest first, so that a mismatch - of status code, say - is found without reading the body, let alone
+# decoding it as JSON.
+_FIELDS_BY_COST = tuple(sorted(_FIELDS, key=lambda field: field.cost))
+
+
 class ResponseMatcher(BaseMatcher[R]):
     def __init__(
         self,
@@ -97,67 +198,70 @@ class ResponseMatcher(BaseMatcher[R]):
         self.history = wrap_matcher(history)
         self.url = wrap_matcher(url)
         self.encoding = wrap_matcher(encoding)
+        self.json_paths: Matcher[str] = ANYTHING
+        self._evaluated: _EvaluatedResponse[R] | None = None
 
     def _matches(self, item: R) -> bool:
-        response_json = self._get_response_json(item)
-        return (
-            self.status_code.matches(item.status_code)
-            and self.body.matches(item.text)
-            and self.content.matches(item.content)
-            and self.json.matches(response_json)
-            and self.headers.matches(item.headers)
-            and self.cookies.matches(item.cookies)
-            and self.elapsed.matches(item.elapsed)
-            and self.history.matches(item.history)
-            and self.url.matches(item.url)
-            and self.encoding.matches(item.encoding)
+        response = self._evaluate(item)
+        return all(
+            matcher.matches(getattr(response, field.value))
+            for field, matcher in self._constrained_fields(_FIELDS_BY_COST)
         )
 
-    @staticmethod
-    def _get_response_json(response: R) -> JsonValue:
-        try:
-            return response.json()
-        except (ValueError, AttributeError, TypeError):
-            return None
+    def _evaluate(self, item: R) -> _EvaluatedResponse[R]:
+        if self._evaluated is None or self._evaluated.response is not item:
+            self._evaluated = _EvaluatedResponse(item)
+        return self._evaluated
+
+    @property
+    def constrains_body(self) -> bool:
+        """Whether any of the body, content or json are to be matched, so the response's body has to be read."""
+        return any(field.matcher in _BODY_FIELDS for field, _ in self._constrained_fields())
+
+    def _constrained_fields(self, fields: Sequence[_Field] = _FIELDS) -> Iterator[tuple[_Field, Matcher[Any]]]:
+        # Unconstrained fields are skipped altogether, so their values are never read.
+        for field in fields:
+            matcher = getattr(self, field.matcher)
+            if not isinstance(matcher, IsAnything):
+                yield field, matcher
 
     def describe_to(self, description: Description) -> None:
         description.append_text("response with")
-        append_matcher_description(self.status_code, "status code", description)
-        append_matcher_description(self.body, "body", description)
-        append_matcher_description(self.content, "content", description)
-        append_matcher_description(self.json, "json", description)
-        append_matcher_description(self.headers, "headers", description)
-        append_matcher_description(self.cookies, "cookies", description)
-        append_matcher_description(self.elapsed, "elapsed", description)
-        append_matcher_description(self.history, "history", description)
-        append_matcher_description(self.url, "url", description)
-        append_matcher_description(self.encoding, "encoding", description)
+        for field, matcher in self._constrained_fields():
+            append_matcher_description(matcher, field.description, description)
 
     def describe_mismatch(self, item: R, mismatch_description: Description) -> None:
+        response = self._evaluate(item)
+        undecoded = self._undecoded_fields(response)
         mismatch_description.append_text("was response with")
-        describe_field_mismatch(self.status_code, "status code", item.status_code, mismatch_description)
-        describe_field_mismatch(self.body, "body", item.text, mismatch_description)
-        describe_field_mismatch(self.content, "content", item.content, mismatch_description)
-        describe_field_mismatch(self.json, "json", self._get_response_json(item), mismatch_description)
-        describe_field_mismatch(self.headers, "headers", item.headers, mismatch_description)
-        describe_field_mismatch(self.cookies, "cookies", item.cookies, mismatch_description)
-        describe_field_mismatch(self.elapsed, "elapsed", item.elapsed, mismatch_description)
-        describe_field_mismatch(self.history, "history", item.history, mismatch_description)
-        describe_field_mismatch(self.url, "url", item.url, mismatch_description)
-        describe_field_mismatch(self.encoding, "encoding", item.encoding, mismatch_description)
+        for field, matcher in self._constrained_fields():
+            if field not in undecoded:
+                describe_field_mismatch(
+                    matcher, field.description, getattr(response, field.value), mismatch_description
+                )
+
+    def _undecoded_fields(self, response: _EvaluatedResponse[R]) -> frozenset[_Field]:
+        # Once a cheaper field has mismatched, the body isn't decoded as JSON just to describe it - so a wrong status
+        # code is reported, along with the body text, without parsing a large JSON document.
+        first_mismatch_cost = next(
+            (
+                field.cost
+                for field, matcher in self._constrained_fields(_FIELDS_BY_COST)
+                if not matcher.matches(getattr(response, field.value))
+            ),
+            math.inf,
+        )
+        return frozenset(
+            field
+            for field, _ in self._constrained_fields()
+            if field.matcher in _DECODED_FIELDS and field.cost > first_mismatch_cost
+        )
 
     def describe_match(self, item: R, match_description: Description) -> None:
+        response = self._evaluate(item)
         match_description.append_text("was response with")
-        describe_field_match(self.status_code, "status code", item.status_code, match_description)
-        describe_field_match(self.body, "body", item.text, match_description)
-        describe_field_match(self.content, "content", item.content, match_description)
-        describe_field_match(self.json, "json", self._get_response_json(item), match_description)
-        describe_field_match(self.headers, "headers", item.headers, match_description)
-        describe_field_match(self.cookies, "cookies", item.cookies, match_description)
-        describe_field_match(self.elapsed, "elapsed", item.elapsed, match_description)
-        describe_field_match(self.history, "history", item.history, match_description)
-        describe_field_match(self.url, "url", item.url, match_description)
-        describe_field_match(self.encoding, "encoding", item.encoding, match_description)
+        for field, matcher in self._constrained_fields():
+            describe_field_match(matcher, field.description, getattr(response, field.value), match_description)
 
     def with_status_code(self, status_code: int | Matcher[int]) -> ResponseMatcher:
         """Matches if the response status code matches the given value or matcher.
@@ -237,6 +341,32 @@ class ResponseMatcher(BaseMatcher[R]):
         """
         return self.with_json(json)
 
+    def with_json_path(self, path: str, matcher: JsonValue | Matcher[JsonValue]) -> ResponseMatcher:
+        """Matches if the value at a JSON path in the response body matches the given value or matcher.
+
+        Unlike :meth:`with_json`, the body isn't decoded as a whole - only the values on the way to the paths are
+        parsed, and parsing stops once every path has been found. Can be called more than once, for different paths.
+
+        :param path: The JSON path, such as ``$.meta.total`` or ``$.items[0]['id']``. See
+                     :meth:`brunns.matchers.data.JsonMatching.with_json_path`.
+        :param matcher: The expected value or matcher.
+        :return: ResponseMatcher, for chaining.
+        """
+        json_paths = self.json_paths if isinstance(self.json_paths, JsonMatching) else JsonMatching()
+        self.json_paths = json_paths.with_json_path(path, matcher)
+        return self
+
+    def and_json_path(self, path: str, matcher: JsonValue | Matcher[JsonValue]) -> ResponseMatcher:
+        """Matches if the value at a JSON path in the response body matches the given value or matcher.
+
+        A synonym for :meth:`with_json_path`.
+
+        :param path: The JSON path.
+        :param matcher: The expected value or matcher.
+        :return: ResponseMatcher, for chaining.
+        """
+        return self.with_json_path(path, matcher)
+
     def with_headers(
         self,
         headers: Mapping[str, str | Matcher[str]] | Matcher[Mapping[str, str | Matcher[str]]],
@@ -372,6 +502,384 @@ class ResponseMatcher(BaseMatcher[R]):
         return self.with_encoding(encoding)
 
 
+@runtime_checkable
+class AsyncResponseProtocol(Protocol):
+    """Structural typing for an async HTTP Response object, such as an httpx response from an ``AsyncClient``."""
+
+    async def aread(self) -> bytes: ...
+
+
+async def assert_that_async(actual: R | Awaitable[R], matcher: Matcher[R], reason: str = "") -> None:
+    """Asserts that an HTTP response, possibly from an async client, matches.
+
+    Like :func:`hamcrest.assert_that`, but the response can be given as an awaitable - a request not yet made, say, so
+    that many requests can be made concurrently with :func:`asyncio.gather`, and each asserted on as it completes.
+    An async response's body is read, with ``aread()``, only if it's needed - so a streamed response's body is left
+    unread by a :class:`ResponseMatcher` without body, content or json matchers. A sync response's body is never
+    read here, so a sync streamed response must already have been read if its body is to be matched.
+
+    :param actual: The response, or an awaitable giving the response.
+    :param matcher: The matcher the response must satisfy, typically built with :func:`is_response`.
+    :param reason: Explanation to include in the failure description.
+    :raises AssertionError: If the response fails to match.
+    """
+    response = await actual if inspect.isawaitable(actual) else actual
+    if _has_async_body(response) and (not isinstance(matcher, ResponseMatcher) or matcher.constrains_body):
+        await cast("AsyncResponseProtocol", response).aread()
+    assert_that(response, matcher, reason)
+
+
+def _has_async_body(response: object) -> bool:
+    # A sync httpx response has aread() too, but its stream can only be read synchronously.
+    stream = getattr(response, "stream", None)
+    return isinstance(response, AsyncResponseProtocol) and (stream is None or isinstance(stream, AsyncIterable))
+
+
+class _Outcome(NamedTuple):
+    request: Any  # httpx.Request
+    response: Any  # httpx.Response, or the httpx.HTTPError raised instead
+    latency: float
+
+
+async def assert_responses_async(
+    checks: Iterable[tuple[Any, Matcher[Any]]],
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    timeout: float = DEFAULT_TIMEOUT,
+    client: Any = None,
+) -> None:
+    """Asserts that the responses to a batch of HTTP requests each match their own matcher.
+
+    The requests are sent concurrently through a single pooled ``httpx`` async client, and each response matched as
+    it arrives. Every response is checked, and all the mismatches reported together, each with the request's
+    latency - the time from sending the request to having read the response - alongside the response's ``elapsed``.
+
+    Requires brunns-matchers to have been installed with the `response` extra.
+
+    :param checks: Pairs of request and response matcher. Each request is an ``httpx.Request``, or a URL to ``GET``.
+    :param max_concurrency: The maximum number of requests to send at once.
+    :param timeout: The timeout, in seconds, for each request.
+    :param client: An ``httpx.AsyncClient`` to send the requests with, instead of creating one. Its own timeout
+                   applies, and it's left open.
+    :raises AssertionError: If any response fails to match, listing each mismatching request.
+    """
+    import httpx2 as httpx  # noqa: PLC0415 - an optional dependency, so only imported if needed.
+
+    checks = list(checks)
+    if client:
+        outcomes = await _send_requests(client, checks, max_concurrency)
+    else:
+        limits = httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency)
+        async with httpx.AsyncClient(limits=limits, timeout=timeout) as new_client:
+            outcomes = await _send_requests(new_client, checks, max_concurrency)
+
+    mismatches = [
+        (outcome, matcher)
+        for outcome, (_, matcher) in zip(outcomes, checks, strict=True)
+        if isinstance(outcome.response, Exception) or not matcher.matches(outcome.response)
+    ]
+    raise_batch_mismatches(
+        "every response to match",
+        "responses",
+        len(checks),
+        mismatches,
+        lambda mismatch, description: _describe_outcome(*mismatch, description),
+    )
+
+
+def assert_responses(
+    checks: Iterable[tuple[Any, Matcher[Any]]],
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> None:
+    """Asserts that the responses to a batch of HTTP requests each match their own matcher.
+
+    A synchronous wrapper around :func:`assert_responses_async`, for use outside an event loop.
+
+    Requires brunns-matchers to have been installed with the `response` extra.
+
+    :param checks: Pairs of request and response matcher. Each request is an ``httpx.Request``, or a URL to ``GET``.
+    :param max_concurrency: The maximum number of requests to send at once.
+    :param timeout: The timeout, in seconds, for each request.
+    :raises AssertionError: If any response fails to match, listing each mismatching request.
+    """
+    asyncio.run(assert_responses_async(checks, max_concurrency=max_concurrency, timeout=timeout))
+
+
+async def _send_requests(
+    client: Any, checks: Sequence[tuple[Any, Matcher[Any]]], max_concurrency: int
+) -> list[_Outcome]:
+    import httpx2 as httpx  # noqa: PLC0415 - an optional dependency, so only imported if needed.
+
+    async def send(request: Any) -> _Outcome:
+        if not isinstance(request, httpx.Request):
+            request = client.build_request("GET", str(request))
+        start = time.perf_counter()
+        try:
+            response: Any = await client.send(request)
+        except httpx.HTTPError as e:
+            response = e
+        return _Outcome(request, response, time.perf_counter() - start)
+
+    return await gather_bounded(send, [request for request, _ in checks], max_concurrency)
+
+
+def _describe_outcome(outcome: _Outcome, matcher: Matcher[Any], description: Description) -> None:
+    description.append_text(f"{outcome.request.method} {outcome.request.url} (latency {outcome.latency:.3f}s")
+    if isinstance(outcome.response, Exception):
+        description.append_text(f"): HTTP error '{outcome.response}'")
+    else:
+        description.append_text(f", elapsed {outcome.response.elapsed.total_seconds():.3f}s): expected ")
+        description.append_description_of(matcher).append_text(" but ")
+        matcher.describe_mismatch(outcome.response, description)
+
+
+@runtime_checkable
+class HttpxStreamProtocol(Protocol):
+    """Structural typing for a streamed httpx response."""
+
+    def iter_bytes(self, chunk_size: int | None = None) -> Iterator[bytes]: ...
+
+
+@runtime_checkable
+class RequestsStreamProtocol(Protocol):
+    """Structural typing for a streamed requests response."""
+
+    def iter_content(self, chunk_size: int | None = 1, decode_unicode: bool = False) -> Iterator[bytes]: ...  # noqa: FBT001, FBT002
+
+
+StreamedResponse: TypeAlias = "HttpxStreamProtocol | RequestsStreamProtocol"
+
+
+def is_streamed_response() -> StreamedResponseMatcher:
+    """Matches a streamed HTTP response's body, a chunk at a time, without holding the whole body in memory.
+
+    This function returns a :class:`StreamedResponseMatcher` which can be refined using builder methods
+    (e.g. ``.with_body_containing(b"</feed>")``).
+
+    :return: A matcher for streamed HTTP responses.
+    """
+    return StreamedResponseMatcher()
+
+
+class _BodyScan:
+    """The result of reading a response body through once, keeping only enough to find matches spanning chunks."""
+
+    def __init__(self, response: StreamedResponse, matcher: StreamedResponseMatcher) -> None:
+        self.response = response
+        self.length = 0
+        self.found: set[int] = set()
+        self.matched: set[int] = set()
+        digest = hashlib.new(matcher.hash_algorithm) if matcher.constrains_hash else None
+        read_to_end = matcher.constrains_whole_body
+        # Only as much of the last chunk is kept as a match spanning chunks could need - none if nothing's searched for.
+        overlap = max(
+            [
+                *(len(needle) - 1 for needle in matcher.needles),
+                *([matcher.max_match_length - 1] * bool(matcher.patterns)),
+            ],
+            default=0,
+        )
+        tail = b""
+        for chunk in _iter_body(response, matcher.chunk_size):
+            self.length += len(chunk)
+            if digest:
+                digest.update(chunk)
+            if not self._all_found(matcher):
+                tail = self._search(tail + chunk, overlap, matcher)
+            if not read_to_end and self._all_found(matcher):
+                _close(response)
+                break
+        self.digest = digest.hexdigest() if digest else ""
+
+    def _search(self, window: bytes, overlap: int, matcher: StreamedResponseMatcher) -> bytes:
+        self.found.update(i for i, needle in enumerate(matcher.needles) if i not in self.found and needle in window)
+        self.matched.update(
+            i for i, pattern in enumerate(matcher.patterns) if i not in self.matched and pattern.search(window)
+        )
+        return window[-overlap:] if overlap > 0 else b""
+
+    def _all_found(self, matcher: StreamedResponseMatcher) -> bool:
+        return len(self.found) == len(matcher.needles) and len(self.matched) == len(matcher.patterns)
+
+
+class StreamedResponseMatcher(BaseMatcher[StreamedResponse]):
+    """Matches a streamed response's body - an httpx response from ``client.stream()``, or a requests response from
+    ``requests.get(..., stream=True)``.
+
+    The body is read through once, in chunks, keeping only the current chunk and the end of the last, so memory use
+    doesn't depend on the size of the body. If nothing but the body's contents is being checked, reading stops as soon
+    as everything's been found, and the response is closed. A body length or hash needs the whole body read.
+
+    :param chunk_size: The size of chunk to read a requests response in. httpx responses are read in chunks as they
+                       arrive.
+    :param max_match_length: The longest regular expression match which is certain to be found.
+    """
+
+    def __init__(
+        self, *, chunk_size: int = DEFAULT_CHUNK_SIZE, max_match_length: int = DEFAULT_MAX_MATCH_LENGTH
+    ) -> None:
+        super().__init__()
+        self.chunk_size = chunk_size
+        self.max_match_length = max_match_length
+        self.needles: list[bytes] = []
+        self.patterns: list[re.Pattern[bytes]] = []
+        self.length: Matcher[int] = ANYTHING
+        self.hash: Matcher[str] = ANYTHING
+        self.hash_algorithm = DEFAULT_HASH_ALGORITHM
+        self._scan: _BodyScan | None = None
+
+    @property
+    def constrains_whole_body(self) -> bool:
+        return not isinstance(self.length, IsAnything) or self.constrains_hash
+
+    @property
+    def constrains_hash(self) -> bool:
+        return not isinstance(self.hash, IsAnything)
+
+    def _matches(self, item: StreamedResponse) -> bool:
+        scan = self._read(item)
+        return (
+            len(scan.found) == len(self.needles)
+            and len(scan.matched) == len(self.patterns)
+            and self.length.matches(scan.length)
+            and self.hash.matches(scan.digest)
+        )
+
+    def _read(self, item: StreamedResponse) -> _BodyScan:
+        # A stream can only be read once, so describe_mismatch() & describe_match() reuse _matches()' scan.
+        if self._scan is None or self._scan.response is not item:
+            self._scan = _BodyScan(item, self)
+        return self._scan
+
+    def describe_to(self, description: Description) -> None:
+        description.append_text("streamed response with")
+        for needle in self.needles:
+            description.append_text(" body containing ").append_description_of(needle)
+        for pattern in self.patterns:
+            description.append_text(" body matching ").append_description_of(pattern.pattern)
+        append_matcher_description(self.length, "body length", description)
+        append_matcher_description(self.hash, f"body {self.hash_algorithm}", description)
+
+    def describe_mismatch(self, item: StreamedResponse, mismatch_description: Description) -> None:
+        scan = self._read(item)
+        mismatch_description.append_text(f"was streamed response with {scan.length} bytes")
+        for needle in (needle for i, needle in enumerate(self.needles) if i not in scan.found):
+            mismatch_description.append_text(", not containing ").append_description_of(needle)
+        for pattern in (pattern for i, pattern in enumerate(self.patterns) if i not in scan.matched):
+            mismatch_description.append_text(", not matching ").append_description_of(pattern.pattern)
+        describe_field_mismatch(self.length, "body length", scan.length, mismatch_description)
+        describe_field_mismatch(self.hash, f"body {self.hash_algorithm}", scan.digest, mismatch_description)
+
+    def describe_match(self, item: StreamedResponse, match_description: Description) -> None:
+        scan = self._read(item)
+        match_description.append_text(f"was streamed response with {scan.length} bytes read")
+        describe_field_match(self.length, "body length", scan.length, match_description)
+        describe_field_match(self.hash, f"body {self.hash_algorithm}", scan.digest, match_description)
+
+    def with_body_containing(self, needle: bytes | str) -> StreamedResponseMatcher:
+        """Matches if the response body contains the given bytes.
+
+        Can be called more than once - the body must contain each.
+
+        :param needle: The expected bytes. A string is encoded as UTF-8.
+        :return: StreamedResponseMatcher, for chaining.
+        """
+        self.needles.append(needle.encode() if isinstance(needle, str) else needle)
+        return self
+
+    def and_body_containing(self, needle: bytes | str) -> StreamedResponseMatcher:
+        """Matches if the response body contains the given bytes.
+
+        A synonym for :meth:`with_body_containing`.
+
+        :param needle: The expected bytes. A string is encoded as UTF-8.
+        :return: StreamedResponseMatcher, for chaining.
+        """
+        return self.with_body_containing(needle)
+
+    def with_body_matching(self, pattern: bytes | re.Pattern[bytes]) -> StreamedResponseMatcher:
+        """Matches if the bytes regular expression is found anywhere in the response body.
+
+        Can be called more than once - the body must match each. Only matches no longer than the matcher's
+        ``max_match_length`` are certain to be found.
+
+        :param pattern: The regular expression.
+        :return: StreamedResponseMatcher, for chaining.
+        """
+        self.patterns.append(re.compile(pattern))
+        return self
+
+    def and_body_matching(self, pattern: bytes | re.Pattern[bytes]) -> StreamedResponseMatcher:
+        """Matches if the bytes regular expression is found anywhere in the response body.
+
+        A synonym for :meth:`with_body_matching`.
+
+        :param pattern: The regular expression.
+        :return: StreamedResponseMatcher, for chaining.
+        """
+        return self.with_body_matching(pattern)
+
+    def with_body_length(self, length: int | Matcher[int]) -> StreamedResponseMatcher:
+        """Matches if the length of the response body, in bytes, matches the given value or matcher.
+
+        :param length: The expected length or matcher.
+        :return: StreamedResponseMatcher, for chaining.
+        """
+        self.length = wrap_matcher(length)
+        return self
+
+    def and_body_length(self, length: int | Matcher[int]) -> StreamedResponseMatcher:
+        """Matches if the length of the response body, in bytes, matches the given value or matcher.
+
+        A synonym for :meth:`with_body_length`.
+
+        :param length: The expected length or matcher.
+        :return: StreamedResponseMatcher, for chaining.
+        """
+        return self.with_body_length(length)
+
+    def with_body_hash(
+        self, hexdigest: str | Matcher[str], algorithm: str = DEFAULT_HASH_ALGORITHM
+    ) -> StreamedResponseMatcher:
+        """Matches if the hash of the response body matches the given hex digest or matcher.
+
+        :param hexdigest: The expected hex digest or matcher.
+        :param algorithm: The :mod:`hashlib` algorithm to hash the body with.
+        :return: StreamedResponseMatcher, for chaining.
+        """
+        self.hash = wrap_matcher(hexdigest)
+        self.hash_algorithm = algorithm
+        return self
+
+    def and_body_hash(
+        self, hexdigest: str | Matcher[str], algorithm: str = DEFAULT_HASH_ALGORITHM
+    ) -> StreamedResponseMatcher:
+        """Matches if the hash of the response body matches the given hex digest or matcher.
+
+        A synonym for :meth:`with_body_hash`.
+
+        :param hexdigest: The expected hex digest or matcher.
+        :param algorithm: The :mod:`hashlib` algorithm to hash the body with.
+        :return: StreamedResponseMatcher, for chaining.
+        """
+        return self.with_body_hash(hexdigest, algorithm)
+
+
+def _iter_body(response: StreamedResponse, chunk_size: int) -> Iterator[bytes]:
+    if isinstance(response, HttpxStreamProtocol):
+        # Chunks as they arrive - given a chunk size, httpx would read ahead to fill each chunk.
+        return response.iter_bytes()
+    return response.iter_content(chunk_size)
+
+
+def _close(response: StreamedResponse) -> None:
+    close = getattr(response, "close", None)
+    if close:
+        close()
+
+
 def redirects_to(url_matcher: UrlProtocol | Matcher[UrlProtocol]) -> Matcher[ResponseProtocol]:
     """Is a response a redirect to a URL matching the supplied matcher?
 
@@ -1,22 +1,38 @@
 # Copyright 2018-2026 Simon Brunning
 from __future__ import annotations
 
+import asyncio
 import logging
+import mmap
+import os
 from datetime import datetime
-from typing import TYPE_CHECKING, cast
+from http import HTTPStatus
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple, TypeAlias, cast
+from urllib.parse import urlparse
 
 import feedparser
 import httpx2 as httpx
 from hamcrest import anything
 from hamcrest.core.base_matcher import BaseMatcher
 from hamcrest.core.helpers.wrap_matcher import wrap_matcher
+from hamcrest.core.string_description import tostring
 from yarl import URL
 
 from brunns.matchers.url import UrlProtocol
-from brunns.matchers.utils import append_matcher_description, describe_field_match, describe_field_mismatch
+from brunns.matchers.utils import (
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_TIMEOUT,
+    LruCache,
+    append_matcher_description,
+    describe_field_match,
+    describe_field_mismatch,
+    gather_bounded,
+    raise_batch_mismatches,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
 
     from hamcrest.core.description import Description
     from hamcrest.core.matcher import Matcher
@@ -24,33 +40,128 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 ANYTHING = anything()
 
+FeedSource: TypeAlias = UrlProtocol | str | bytes | os.PathLike[str]
 
-class RssFeedMatcher(BaseMatcher[UrlProtocol]):
+
+class FeedCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    currsize: int
+
+
+class _FeedCache:
+    """Parsed feeds, by URL, revalidated with a conditional GET each time they're needed.
+
+    The ``ETag`` and ``Last-Modified`` values from the last full download are sent back as ``If-None-Match`` and
+    ``If-Modified-Since``, and if the server responds ``304 Not Modified`` the feed parsed last time is reused.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._feeds: LruCache[str, feedparser.FeedParserDict] = LruCache()
+
+    def parse(self, url: str) -> feedparser.FeedParserDict:
+        cached = self._feeds.get(url)
+        if cached is None:
+            actual = feedparser.parse(url)
+        else:
+            actual = feedparser.parse(url, etag=cached.get("etag"), modified=cached.get("modified"))
+            if actual.get("status") == HTTPStatus.NOT_MODIFIED:
+                self._feeds.count_hit()
+                return cached
+
+        self._feeds.count_miss()
+        if actual.get("etag") or actual.get("modified"):
+            self._feeds.put(url, actual)
+        else:
+            self._feeds.discard(url)
+        return actual
+
+    def clear(self) -> None:
+        self._feeds.clear()
+
+    def info(self) -> FeedCacheInfo:
+        return FeedCacheInfo(self._feeds.hits, self._feeds.misses, len(self._feeds))
+
+
+_feed_cache = _FeedCache()
+
+
+def parse_feed(source: FeedSource) -> feedparser.FeedParserDict:
+    """Parses an RSS feed from a URL, the feed's body, or a local file.
+
+    ``bytes`` values are parsed as the feed's body, and :class:`os.PathLike` values are memory-mapped from disk, so
+    neither touches the network. Other values are converted to strings - ``http://`` and ``https://`` URLs are
+    fetched (through the feed cache, if it's been enabled with :func:`enable_feed_cache`), and anything else is read
+    as a file name if there's such a file, or parsed as the feed's body if not.
+
+    Requires brunns-matchers to have been installed with the `rss` extra.
+
+    :param source: The feed URL, body or path.
+    :return: The parsed feed.
+    """
+    if isinstance(source, bytes | bytearray | memoryview):
+        return feedparser.parse(bytes(source))
+    if isinstance(source, os.PathLike):
+        return _parse_feed_file(Path(source))
+    url = str(source)
+    if _feed_cache.enabled and urlparse(url).scheme in ("http", "https"):
+        return _feed_cache.parse(url)
+    return feedparser.parse(url)
+
+
+def _parse_feed_file(path: Path) -> feedparser.FeedParserDict:
+    with path.open("rb") as f:
+        if not os.fstat(f.fileno()).st_size:
+            return feedparser.parse(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return feedparser.parse(mapped)
+
+
+class _ParsedFeed:
+    """The outcome of parsing a feed - either the parsed feed, or the exception raised trying."""
+
+    def __init__(self, source: FeedSource) -> None:
+        self.source = source
+        self.feed: feedparser.FeedParserDict | None = None
+        self.error: ValueError | httpx.HTTPError | None = None
+        try:
+            self.feed = parse_feed(source)
+        except (ValueError, httpx.HTTPError) as e:
+            self.error = e
+
+
+class RssFeedMatcher(BaseMatcher[FeedSource]):
     def __init__(self):
         self.title: Matcher[str] = ANYTHING
         self.link: Matcher[UrlProtocol] = ANYTHING
         self.description: Matcher[str] = ANYTHING
         self.published: Matcher[datetime | None] = ANYTHING
         self.entries: Matcher[list[feedparser.FeedParserDict]] = ANYTHING
-
-    def _matches(self, item: UrlProtocol) -> bool:
-        try:
-            actual = feedparser.parse(str(item))
-        except (ValueError, httpx.HTTPError):
+        self._parsed: _ParsedFeed | None = None
+
+    def _parse(self, item: FeedSource) -> _ParsedFeed:
+        # Reuses the feed parsed by _matches(), so describing the outcome doesn't fetch or parse it again.
+        if self._parsed is None or self._parsed.source is not item:
+            self._parsed = _ParsedFeed(item)
+        return self._parsed
+
+    def _matches(self, item: FeedSource) -> bool:
+        # Always parsed afresh here, as a feed may have changed since the last assertion against it.
+        self._parsed = _ParsedFeed(item)
+        actual = self._parsed.feed
+        if actual is None or not actual.feed:
             return False
-        else:
-            if not actual.feed:
-                return False
-
-            feed = cast("feedparser.FeedParserDict", actual.feed)
-            published = self._get_published_date(feed)
-            return (
-                self.title.matches(cast("str", feed.get("title", "")))
-                and self.link.matches(cast("UrlProtocol", URL(cast("str", feed.get("link", "")))))
-                and self.description.matches(cast("str", feed.get("description", "")))
-                and self.published.matches(published)
-                and self.entries.matches(actual.entries)
-            )
+
+        feed = cast("feedparser.FeedParserDict", actual.feed)
+        published = self._get_published_date(feed)
+        return (
+            self.title.matches(cast("str", feed.get("title", "")))
+            and self.link.matches(cast("UrlProtocol", URL(cast("str", feed.get("link", "")))))
+            and self.description.matches(cast("str", feed.get("description", "")))
+            and self.published.matches(published)
+            and self.entries.matches(actual.entries)
+        )
 
     def describe_to(self, description: Description) -> None:
         description.append_text("RSS feed with")
@@ -60,32 +171,33 @@ class RssFeedMatcher(BaseMatcher[UrlProtocol]):
         append_matcher_description(self.published, "published", description)
         append_matcher_description(self.entries, "entries", description)
 
-    def describe_mismatch(self, item: UrlProtocol, mismatch_description: Description) -> None:
-        try:
-            actual = feedparser.parse(str(item))
-        except ValueError as e:
-            mismatch_description.append_text(f"RSS parsing failed with '{e}'\nfor value {item}")
-        except httpx.HTTPError as e:
-            mismatch_description.append_text(f"HTTP error '{e}'\nfor URL {item}")
-        else:
-            if not actual.feed:
-                mismatch_description.append_text(f"RSS feed was empty/invalid for value {item}")
-                return
-            feed = cast("feedparser.FeedParserDict", actual.feed)
-            mismatch_description.append_text("was RSS feed with")
-            describe_field_mismatch(self.title, "title", cast("str", feed.get("title", "")), mismatch_description)
-            describe_field_mismatch(
-                self.link, "link", cast("UrlProtocol", URL(cast("str", feed.get("link", "")))), mismatch_description
-            )
-            describe_field_mismatch(
-                self.description, "description", cast("str", feed.get("description", "")), mismatch_description
-            )
-            published = self._get_published_date(feed)
-            describe_field_mismatch(self.published, "published", published, mismatch_description)
-            describe_field_mismatch(self.entries, "entries", actual.entries, mismatch_description)
+    def describe_mismatch(self, item: FeedSource, mismatch_description: Description) -> None:
+        parsed = self._parse(item)
+        if isinstance(parsed.error, httpx.HTTPError):
+            mismatch_description.append_text(f"HTTP error '{parsed.error}'\nfor URL {item}")
+            return
+        if parsed.error:
+            mismatch_description.append_text(f"RSS parsing failed with '{parsed.error}'\nfor value {item}")
+            return
+        actual = cast("feedparser.FeedParserDict", parsed.feed)
+        if not actual.feed:
+            mismatch_description.append_text(f"RSS feed was empty/invalid for value {item}")
+            return
+        feed = cast("feedparser.FeedParserDict", actual.feed)
+        mismatch_description.append_text("was RSS feed with")
+        describe_field_mismatch(self.title, "title", cast("str", feed.get("title", "")), mismatch_description)
+        describe_field_mismatch(
+            self.link, "link", cast("UrlProtocol", URL(cast("str", feed.get("link", "")))), mismatch_description
+        )
+        describe_field_mismatch(
+            self.description, "description", cast("str", feed.get("description", "")), mismatch_description
+        )
+        published = self._get_published_date(feed)
+        describe_field_mismatch(self.published, "published", published, mismatch_description)
+        describe_field_mismatch(self.entries, "entries", actual.entries, mismatch_description)
 
-    def describe_match(self, item: UrlProtocol, match_description: Description) -> None:
-        actual = feedparser.parse(str(item))
+    def describe_match(self, item: FeedSource, match_description: Description) -> None:
+        actual = cast("feedparser.FeedParserDict", self._parse(item).feed)
         feed = cast("feedparser.FeedParserDict", actual.feed)
         match_description.append_text("was RSS feed with")
         describe_field_match(self.title, "title", cast("str", feed.get("title", "")), match_description)
@@ -387,3 +499,129 @@ def is_rss_category() -> RssCategoryMatcher:
     :return: A matcher for an RSS category.
     """
     return RssCategoryMatcher()
+
+
+def enable_feed_cache() -> None:
+    """Caches feeds fetched by URL, revalidating them with conditional GETs.
+
+    Once enabled, each feed fetched by URL is kept, parsed, along with its ``ETag`` and ``Last-Modified`` headers.
+    Later fetches of the same URL send those back as ``If-None-Match`` and ``If-Modified-Since``, and if the server
+    responds ``304 Not Modified``, the feed is neither downloaded nor parsed again. Feeds served without either
+    header aren't cached.
+
+    Requires brunns-matchers to have been installed with the `rss` extra.
+    """
+    _feed_cache.enabled = True
+
+
+def disable_feed_cache() -> None:
+    """Stops caching feeds fetched by URL, and discards those cached."""
+    _feed_cache.enabled = False
+    _feed_cache.clear()
+
+
+def clear_feed_cache() -> None:
+    """Discards all cached feeds, and resets the cache statistics."""
+    _feed_cache.clear()
+
+
+def feed_cache_info() -> FeedCacheInfo:
+    """Reports feed cache statistics.
+
+    :return: A named tuple of ``hits`` (feeds reused after a ``304 Not Modified``), ``misses`` (feeds downloaded and
+             parsed) and ``currsize`` (feeds cached).
+    """
+    return _feed_cache.info()
+
+
+async def assert_feeds_async(
+    urls: Iterable[UrlProtocol | str],
+    matcher: Matcher[FeedSource] | None = None,
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    timeout: float = DEFAULT_TIMEOUT,
+    client: httpx.AsyncClient | None = None,
+) -> None:
+    """Asserts that every one of a batch of RSS feed URLs matches a feed matcher.
+
+    The feeds are fetched concurrently through a single pooled ``httpx`` async client, then each body is matched
+    locally. Every feed is checked, and all the mismatches reported together.
+
+    Requires brunns-matchers to have been installed with the `rss` extra.
+
+    :param urls: The feed URLs.
+    :param matcher: The matcher each feed must satisfy, typically built with :func:`is_rss_feed`. Defaults to any
+                    valid RSS feed.
+    :param max_concurrency: The maximum number of feeds to fetch at once.
+    :param timeout: The timeout, in seconds, for each fetch.
+    :param client: A client to fetch the feeds with, instead of creating one. Its own timeout applies, and it's
+                   left open.
+    :raises AssertionError: If any feed fails to match, listing each mismatching feed.
+    """
+    urls = list(urls)
+    matcher = matcher or is_rss_feed()
+    if client:
+        bodies = await _fetch_feeds(client, urls, max_concurrency)
+    else:
+        limits = httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency)
+        async with httpx.AsyncClient(limits=limits, timeout=timeout, follow_redirects=True) as new_client:
+            bodies = await _fetch_feeds(new_client, urls, max_concurrency)
+
+    mismatches = [
+        (url, body)
+        for url, body in zip(urls, bodies, strict=True)
+        if not isinstance(body, bytes) or not matcher.matches(body)
+    ]
+    raise_batch_mismatches(
+        f"every feed to be {tostring(matcher)}",
+        "feeds",
+        len(urls),
+        mismatches,
+        lambda mismatch, description: _describe_feed_mismatch(*mismatch, matcher, description),
+    )
+
+
+def assert_feeds(
+    urls: Iterable[UrlProtocol | str],
+    matcher: Matcher[FeedSource] | None = None,
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> None:
+    """Asserts that every one of a batch of RSS feed URLs matches a feed matcher.
+
+    A synchronous wrapper around :func:`assert_feeds_async`, for use outside an event loop.
+
+    Requires brunns-matchers to have been installed with the `rss` extra.
+
+    :param urls: The feed URLs.
+    :param matcher: The matcher each feed must satisfy. Defaults to any valid RSS feed.
+    :param max_concurrency: The maximum number of feeds to fetch at once.
+    :param timeout: The timeout, in seconds, for each fetch.
+    :raises AssertionError: If any feed fails to match, listing each mismatching feed.
+    """
+    asyncio.run(assert_feeds_async(urls, matcher, max_concurrency=max_concurrency, timeout=timeout))
+
+
+async def _fetch_feeds(
+    client: httpx.AsyncClient, urls: Sequence[UrlProtocol | str], max_concurrency: int
+) -> list[bytes | httpx.HTTPError]:
+    async def fetch(url: UrlProtocol | str) -> bytes | httpx.HTTPError:
+        try:
+            response = await client.get(str(url))
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            return e
+        return response.content
+
+    return await gather_bounded(fetch, urls, max_concurrency)
+
+
+def _describe_feed_mismatch(
+    url: UrlProtocol | str, body: bytes | httpx.HTTPError, matcher: Matcher[FeedSource], description: Description
+) -> None:
+    description.append_text(f"{url}: ")
+    if isinstance(body, bytes):
+        matcher.describe_mismatch(body, description)
+    else:
+        description.append_text(f"HTTP error '{body}'")
@@ -3,20 +3,34 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Protocol, TypeVar, runtime_checkable
-
-from hamcrest import anything
+import asyncio
+import hashlib
+import os
+import shlex
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple, Protocol, TypeAlias, TypeVar, cast, runtime_checkable
+
+from hamcrest import anything, matches_regexp
 from hamcrest.core.base_matcher import BaseMatcher
+from hamcrest.core.core.isanything import IsAnything
 from hamcrest.core.helpers.wrap_matcher import wrap_matcher
+from hamcrest.core.string_description import tostring
 
 from brunns.matchers.utils import (
+    LruCache,
     append_matcher_description,
     describe_field_match,
     describe_field_mismatch,
+    gather_bounded,
+    raise_batch_mismatches,
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    import re
+    import subprocess
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
 
     from hamcrest.core.description import Description
     from hamcrest.core.matcher import Matcher
@@ -48,6 +62,55 @@ P = TypeVar("P", bound=ProcResultProtocol)
 
 ANYTHING = anything()
 
+OUTPUT_ENCODING = "utf-8"
+DEFAULT_MAX_CONCURRENCY = os.cpu_count() or 1
+HASH_ALGORITHM = "sha256"
+HASH_CHUNK_SIZE = 1024 * 1024
+DEFAULT_FILE_HASH_CACHE_SIZE = 65536
+
+OutputSource: TypeAlias = "str | Iterable[str] | Iterable[bytes]"
+
+
+@dataclass(frozen=True)
+class CommandResult:
+    """The result of running a command, in the shape of a ``scripttest.ProcResult``, so it can be matched by
+    :class:`ProcResultMatcher`. Commands run outside scripttest don't track files, so those fields are empty.
+    """
+
+    returncode: int
+    stdout: str
+    stderr: str
+    args: Sequence[str]
+    stdin: bytes = b""
+    files_created: Mapping[str, Any] = field(default_factory=dict)
+    files_updated: Mapping[str, Any] = field(default_factory=dict)
+    files_deleted: Mapping[str, Any] = field(default_factory=dict)
+
+
+def from_completed_process(process: subprocess.CompletedProcess[Any], stdin: bytes = b"") -> CommandResult:
+    """Adapts a :class:`subprocess.CompletedProcess` for matching with :class:`ProcResultMatcher`.
+
+    Captured bytes output is decoded as UTF-8, and output which wasn't captured is treated as empty.
+
+    :param process: The completed process, as returned by :func:`subprocess.run`.
+    :param stdin: The input the process was given, if any.
+    :return: The process's result.
+    """
+    args = [process.args] if isinstance(process.args, (str, bytes, os.PathLike)) else process.args
+    return CommandResult(
+        returncode=process.returncode,
+        stdout=_decode_output(process.stdout),
+        stderr=_decode_output(process.stderr),
+        args=[os.fsdecode(arg) for arg in args],
+        stdin=stdin,
+    )
+
+
+def _decode_output(output: str | bytes | None) -> str:
+    if isinstance(output, bytes):
+        return output.decode(OUTPUT_ENCODING, "replace")
+    return output or ""
+
 
 def is_proc_result() -> ProcResultMatcher:
     """Matches a ``scripttest.ProcResult`` object.
@@ -291,3 +354,443 @@ class ProcResultMatcher(BaseMatcher[P]):
         :return: Self, for chaining.
         """
         return self.with_files_updated(files_updated)
+
+
+def is_output() -> OutputMatcher:
+    """Matches process output, a line at a time.
+
+    This function returns an :class:`OutputMatcher` which can be refined using builder methods
+    (e.g. ``.with_line(contains_string("ERROR"))``).
+
+    :return: A matcher for process output.
+    """
+    return OutputMatcher()
+
+
+class _OutputScan:
+    """The result of reading output through once - the line count, and the first line matched by each matcher."""
+
+    def __init__(self, source: OutputSource, line_matchers: Sequence[Matcher[str]], *, count_lines: bool) -> None:
+        self.source = source
+        self.line_count = 0
+        self.matched_lines: dict[int, str] = {}
+        for line in _output_lines(source):
+            self.line_count += 1
+            self.matched_lines.update(
+                (index, line)
+                for index, matcher in enumerate(line_matchers)
+                if index not in self.matched_lines and matcher.matches(line)
+            )
+            if not count_lines and len(self.matched_lines) == len(line_matchers):
+                break
+
+
+class OutputMatcher(BaseMatcher[OutputSource]):
+    """Matches process output, such as a :class:`subprocess.Popen` pipe, a log file, or a ``str``.
+
+    The output is read through once, a line at a time, and lines aren't kept, so memory use doesn't depend on the
+    size of the output. Line endings are stripped before lines are matched. Reading stops as soon as every line
+    matcher has matched, unless a line count is specified. Bytes lines are decoded as UTF-8.
+
+    Since :class:`str` output can be matched too, an ``OutputMatcher`` can be used to match
+    :class:`ProcResultMatcher`'s ``stdout`` or ``stderr``.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.lines: list[Matcher[str]] = []
+        self.line_count: Matcher[int] = ANYTHING
+        self._scan: _OutputScan | None = None
+
+    def _matches(self, item: OutputSource) -> bool:
+        scan = self._read(item)
+        return len(scan.matched_lines) == len(self.lines) and self.line_count.matches(scan.line_count)
+
+    def _read(self, item: OutputSource) -> _OutputScan:
+        # An iterator can only be read once, so describe_mismatch() & describe_match() reuse _matches()' scan.
+        if self._scan is None or self._scan.source is not item:
+            self._scan = _OutputScan(item, self.lines, count_lines=not isinstance(self.line_count, IsAnything))
+        return self._scan
+
+    def describe_to(self, description: Description) -> None:
+        description.append_text("output with")
+        for line in self.lines:
+            append_matcher_description(line, "line", description)
+        append_matcher_description(self.line_count, "line count", description)
+
+    def describe_mismatch(self, item: OutputSource, mismatch_description: Description) -> None:
+        scan = self._read(item)
+        mismatch_description.append_text(f"was output with {scan.line_count} lines")
+        for index, line in enumerate(self.lines):
+            if index not in scan.matched_lines:
+                mismatch_description.append_text(", none matching ").append_description_of(line)
+        describe_field_mismatch(self.line_count, "line count", scan.line_count, mismatch_description)
+
+    def describe_match(self, item: OutputSource, match_description: Description) -> None:
+        scan = self._read(item)
+        match_description.append_text("was output with")
+        for index, line in scan.matched_lines.items():
+            describe_field_match(self.lines[index], "line", line, match_description)
+        describe_field_match(self.line_count, "line count", scan.line_count, match_description)
+
+    def with_line(self, line: str | Matcher[str]):
+        """Matches if any line of the output matches the given value or matcher.
+
+        Can be called more than once - each value or matcher must be matched by some line.
+
+        :param line: The expected line, without its line ending, or matcher.
+        :return: Self, for chaining.
+        """
+        self.lines.append(wrap_matcher(line))
+        return self
+
+    def and_line(self, line: str | Matcher[str]):
+        """Matches if any line of the output matches the given value or matcher.
+
+        A synonym for :meth:`with_line`.
+
+        :param line: The expected line, without its line ending, or matcher.
+        :return: Self, for chaining.
+        """
+        return self.with_line(line)
+
+    def with_line_matching(self, pattern: str | re.Pattern[str]):
+        """Matches if the regular expression is found anywhere in any line of the output.
+
+        :param pattern: The regular expression.
+        :return: Self, for chaining.
+        """
+        return self.with_line(matches_regexp(pattern))
+
+    def and_line_matching(self, pattern: str | re.Pattern[str]):
+        """Matches if the regular expression is found anywhere in any line of the output.
+
+        A synonym for :meth:`with_line_matching`.
+
+        :param pattern: The regular expression.
+        :return: Self, for chaining.
+        """
+        return self.with_line_matching(pattern)
+
+    def with_line_count(self, line_count: int | Matcher[int]):
+        """Matches if the number of lines of output matches the given value or matcher.
+
+        The output has to be read to the end to count its lines.
+
+        :param line_count: The expected number of lines, or matcher.
+        :return: Self, for chaining.
+        """
+        self.line_count = wrap_matcher(line_count)
+        return self
+
+    def and_line_count(self, line_count: int | Matcher[int]):
+        """Matches if the number of lines of output matches the given value or matcher.
+
+        A synonym for :meth:`with_line_count`.
+
+        :param line_count: The expected number of lines, or matcher.
+        :return: Self, for chaining.
+        """
+        return self.with_line_count(line_count)
+
+
+async def run_commands_async(
+    commands: Iterable[Sequence[str]],
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    cwd: str | os.PathLike[str] | None = None,
+    env: Mapping[str, str] | None = None,
+    timeout: float | None = None,
+) -> list[CommandResult | OSError]:
+    """Runs a batch of commands concurrently, capturing their output.
+
+    :param commands: The commands to run, each a sequence of the program and its arguments.
+    :param max_concurrency: The maximum number of commands to run at once. Defaults to the number of CPUs.
+    :param cwd: The working directory to run the commands in.
+    :param env: The environment to run the commands with, instead of inheriting this process's.
+    :param timeout: The timeout, in seconds, for each command. A command still running then is killed.
+    :return: The commands' results, in the same order as the commands - or, for a command which couldn't be run or
+             timed out, the :class:`OSError` raised instead.
+    """
+
+    async def run(command: Sequence[str]) -> CommandResult | OSError:
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, cwd=cwd, env=env
+            )
+        except OSError as e:
+            return e
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            return TimeoutError(f"Timed out after {timeout}s")
+        return CommandResult(
+            returncode=cast("int", process.returncode),
+            stdout=_decode_output(stdout),
+            stderr=_decode_output(stderr),
+            args=list(command),
+        )
+
+    return await gather_bounded(run, commands, max_concurrency)
+
+
+async def assert_commands_async(
+    commands: Iterable[Sequence[str]],
+    matcher: Matcher[CommandResult] | None = None,
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    cwd: str | os.PathLike[str] | None = None,
+    env: Mapping[str, str] | None = None,
+    timeout: float | None = None,
+) -> None:
+    """Asserts that every one of a batch of commands' results matches a proc result matcher.
+
+    The commands are run concurrently with :func:`run_commands_async`. Every result is checked, and all the
+    mismatches reported together - including commands which couldn't be run, or timed out.
+
+    :param commands: The commands to run, each a sequence of the program and its arguments.
+    :param matcher: The matcher each result must satisfy, typically built with :func:`is_proc_result`. Defaults to
+                    a return code of 0.
+    :param max_concurrency: The maximum number of commands to run at once. Defaults to the number of CPUs.
+    :param cwd: The working directory to run the commands in.
+    :param env: The environment to run the commands with, instead of inheriting this process's.
+    :param timeout: The timeout, in seconds, for each command.
+    :raises AssertionError: If any result fails to match, listing each mismatching command.
+    """
+    commands = list(commands)
+    matcher = matcher or is_proc_result().with_returncode(0)
+    results = await run_commands_async(commands, max_concurrency=max_concurrency, cwd=cwd, env=env, timeout=timeout)
+
+    def describe_mismatch(mismatch: tuple[Sequence[str], CommandResult | OSError], description: Description) -> None:
+        command, result = mismatch
+        description.append_text(f"{shlex.join(command)}: ")
+        if isinstance(result, OSError):
+            description.append_text(f"{type(result).__name__} '{result}'")
+        else:
+            matcher.describe_mismatch(result, description)
+
+    raise_batch_mismatches(
+        f"every command's result to be {tostring(matcher)}",
+        "commands",
+        len(results),
+        [
+            (command, result)
+            for command, result in zip(commands, results, strict=True)
+            if isinstance(result, OSError) or not matcher.matches(result)
+        ],
+        describe_mismatch,
+    )
+
+
+def assert_commands(
+    commands: Iterable[Sequence[str]],
+    matcher: Matcher[CommandResult] | None = None,
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    cwd: str | os.PathLike[str] | None = None,
+    env: Mapping[str, str] | None = None,
+    timeout: float | None = None,
+) -> None:
+    """Asserts that every one of a batch of commands' results matches a proc result matcher.
+
+    A synchronous wrapper around :func:`assert_commands_async`, for use outside an event loop.
+
+    :param commands: The commands to run, each a sequence of the program and its arguments.
+    :param matcher: The matcher each result must satisfy. Defaults to a return code of 0.
+    :param max_concurrency: The maximum number of commands to run at once. Defaults to the number of CPUs.
+    :param cwd: The working directory to run the commands in.
+    :param env: The environment to run the commands with, instead of inheriting this process's.
+    :param timeout: The timeout, in seconds, for each command.
+    :raises AssertionError: If any result fails to match, listing each mismatching command.
+    """
+    asyncio.run(
+        assert_commands_async(commands, matcher, max_concurrency=max_concurrency, cwd=cwd, env=env, timeout=timeout)
+    )
+
+
+class FileHashCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _FileHashCache:
+    """LRU cache of file digests, keyed by path, reused for as long as the file's size and modification time match.
+
+    Like ``make``, this relies on modification times - a file rewritten with the same size, within the file system's
+    timestamp resolution, won't be rehashed. Used from several threads at once, so the bookkeeping is locked, though
+    the hashing itself isn't.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._digests: LruCache[Path, tuple[int, int, str]] = LruCache(maxsize)
+
+    def digest(self, path: Path) -> str:
+        stat = path.stat()
+        cached = self._digests.get(path)
+        if cached and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+            self._digests.count_hit()
+            return cached[2]
+
+        self._digests.count_miss()
+        digest = _hash_file(path)
+        self._digests.put(path, (stat.st_size, stat.st_mtime_ns, digest))
+        return digest
+
+    def resize(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._digests.resize(maxsize)
+
+    def clear(self) -> None:
+        self._digests.clear()
+
+    def info(self) -> FileHashCacheInfo:
+        return FileHashCacheInfo(self._digests.hits, self._digests.misses, self.maxsize, len(self._digests))
+
+
+_file_hash_cache = _FileHashCache(DEFAULT_FILE_HASH_CACHE_SIZE)
+
+
+def tree_manifest(root: str | os.PathLike[str], *, max_workers: int | None = None) -> dict[str, str]:
+    """Builds a manifest of the files under a directory, for matching with :func:`tree_matches_manifest` later.
+
+    :param root: The directory.
+    :param max_workers: The maximum number of threads to hash files with.
+    :return: Each file's hex SHA-256 digest, keyed by its path relative to the directory, with ``/`` separators.
+    """
+    files = sorted(_list_files(Path(root)))
+    return dict(zip(files, _hash_files(Path(root), files, max_workers), strict=True))
+
+
+def tree_matches_manifest(manifest: Mapping[str, str], *, max_workers: int | None = None) -> TreeMatchesManifest:
+    """Matches a directory whose files are exactly those in a manifest, with the same contents.
+
+    :param manifest: Each file's hex SHA-256 digest, keyed by its path relative to the directory, with ``/``
+                     separators, as built by :func:`tree_manifest`.
+    :param max_workers: The maximum number of threads to hash files with.
+    :return: The matcher.
+    """
+    return TreeMatchesManifest(manifest, max_workers=max_workers)
+
+
+class _ManifestDiff(NamedTuple):
+    missing: list[str]
+    unexpected: list[str]
+    changed: list[str]
+
+
+class TreeMatchesManifest(BaseMatcher[str | os.PathLike[str]]):
+    """Matches a directory against a manifest of file digests, such as the files a code generator should write.
+
+    Files are hashed concurrently, in a thread pool, and only files in both the directory and the manifest are hashed
+    at all. Digests are cached, and reused while a file's size and modification time are unchanged, so unchanged files
+    aren't reread by later assertions. Mismatches list only the differing paths.
+    """
+
+    def __init__(self, manifest: Mapping[str, str], *, max_workers: int | None = None) -> None:
+        super().__init__()
+        self.manifest = manifest
+        self.max_workers = max_workers
+        self._diff: tuple[str | os.PathLike[str], _ManifestDiff] | None = None
+
+    def _matches(self, item: str | os.PathLike[str]) -> bool:
+        # Always compared afresh here, as the tree may have changed since the last assertion against it.
+        self._diff = (item, self._diff_tree(item))
+        return not any(self._diff[1])
+
+    def _compare(self, item: str | os.PathLike[str]) -> _ManifestDiff:
+        # Reuses the diff made by _matches(), so describing the outcome doesn't hash each file again.
+        if self._diff is None or self._diff[0] is not item:
+            self._diff = (item, self._diff_tree(item))
+        return self._diff[1]
+
+    def _diff_tree(self, item: str | os.PathLike[str]) -> _ManifestDiff:
+        root = Path(item)
+        files = _list_files(root)
+        common = [path for path in self.manifest if path in files]
+        digests = _hash_files(root, common, self.max_workers)
+        return _ManifestDiff(
+            missing=sorted(path for path in self.manifest if path not in files),
+            unexpected=sorted(path for path in files if path not in self.manifest),
+            changed=sorted(path for path, digest in zip(common, digests, strict=True) if digest != self.manifest[path]),
+        )
+
+    def describe_to(self, description: Description) -> None:
+        description.append_text(f"directory tree matching manifest of {len(self.manifest)} files")
+
+    def describe_mismatch(self, item: str | os.PathLike[str], mismatch_description: Description) -> None:
+        mismatch_description.append_text("was directory tree ").append_description_of(item).append_text(" with")
+        for name, paths in self._compare(item)._asdict().items():
+            if paths:
+                mismatch_description.append_text(f" {name}: ").append_description_of(paths)
+
+    def describe_match(self, item: str | os.PathLike[str], match_description: Description) -> None:
+        match_description.append_text("was directory tree ").append_description_of(item)
+        match_description.append_text(f" matching manifest of {len(self.manifest)} files")
+
+
+def set_file_hash_cache_size(maxsize: int) -> None:
+    """Sets how many file digests are kept for reuse by :func:`tree_manifest` and :func:`tree_matches_manifest`.
+
+    Set to ``0`` to disable caching. Shrinking the cache evicts the least recently used digests.
+
+    :param maxsize: The maximum number of digests to keep.
+    """
+    _file_hash_cache.resize(maxsize)
+
+
+def clear_file_hash_cache() -> None:
+    """Discards all cached file digests, and resets the cache statistics."""
+    _file_hash_cache.clear()
+
+
+def file_hash_cache_info() -> FileHashCacheInfo:
+    """Reports file digest cache statistics.
+
+    :return: A named tuple of ``hits``, ``misses``, ``maxsize`` and ``currsize``.
+    """
+    return _file_hash_cache.info()
+
+
+def _list_files(root: Path) -> set[str]:
+    return {
+        (Path(directory) / name).relative_to(root).as_posix() for directory, _, names in os.walk(root) for name in names
+    }
+
+
+def _hash_files(root: Path, paths: Sequence[str], max_workers: int | None) -> list[str]:
+    # Hashing and reading release the GIL, so threads can hash files in parallel.
+    with ThreadPoolExecutor(max_workers) as executor:
+        return list(executor.map(_file_hash_cache.digest, (root / path for path in paths)))
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.new(HASH_ALGORITHM)
+    buffer = bytearray(HASH_CHUNK_SIZE)
+    view = memoryview(buffer)
+    with path.open("rb", buffering=0) as f:
+        while size := f.readinto(buffer):
+            digest.update(view[:size])
+    return digest.hexdigest()
+
+
+def _output_lines(source: OutputSource) -> Iterator[str]:
+    lines = _split_lines(source) if isinstance(source, str) else source
+    for line in lines:
+        text = line.decode(OUTPUT_ENCODING, "replace") if isinstance(line, bytes) else line
+        yield text.rstrip("\r\n")
+
+
+def _split_lines(text: str) -> Iterator[str]:
+    # Unlike str.splitlines(), yields one line at a time rather than building a list of them all.
+    start = 0
+    while start < len(text):
+        end = text.find("\n", start)
+        if end == -1:
+            end = len(text)
+        yield text[start:end]
+        start = end + 1
@@ -2,14 +2,23 @@
 from __future__ import annotations
 
 import email
+import mailbox
+import mmap
+import os
 import re
+from contextlib import contextmanager
 from dataclasses import dataclass
-from re import Match
-from typing import TYPE_CHECKING, cast
+from email.parser import HeaderParser
+from email.utils import getaddresses, parseaddr
+from functools import cached_property, partial
+from itertools import takewhile
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple, TypeAlias, cast
 
 from deprecated import deprecated
-from hamcrest import anything
+from hamcrest import anything, has_item, has_properties
 from hamcrest.core.base_matcher import BaseMatcher
+from hamcrest.core.core.isanything import IsAnything
 from hamcrest.core.helpers.wrap_matcher import wrap_matcher
 
 from brunns.matchers.utils import (
@@ -19,10 +28,22 @@ from brunns.matchers.utils import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+    from email.message import Message
+
     from hamcrest.core.description import Description
     from hamcrest.core.matcher import Matcher
 
 ANYTHING = anything()
+END_OF_HEADERS = re.compile(r"\r?\n\r?\n")
+END_OF_MBOX_HEADERS = re.compile(rb"\r?\n\r?\n")
+MBOX_SEPARATOR = b"\nFrom "
+MBOX_FROM_LINE = MBOX_SEPARATOR[1:]
+MAILBOX_ENCODING = "utf-8"
+DEFAULT_BODY_TYPE = "text/plain"
+UNENCODED_TRANSFER_ENCODINGS = frozenset({"", "7bit", "8bit", "binary"})
+
+MailboxSource: TypeAlias = mailbox.Mailbox | os.PathLike[str] | str
 
 
 @dataclass
@@ -35,6 +56,133 @@ class Email:
     body_text: str
 
 
+class Address(NamedTuple):
+    """An email address, with the display name it was given, if any."""
+
+    name: str
+    address: str
+
+
+class Attachment(NamedTuple):
+    """An email attachment's details. The size is of the decoded content."""
+
+    filename: str
+    content_type: str
+    size: int
+
+
+class _LazyEmail:
+    """An email's fields, each parsed from the raw message only when first needed.
+
+    Headers are parsed from the header block alone, so checking them never touches a large body. The full message is
+    only parsed if the body is needed.
+    """
+
+    def __init__(self, raw: str) -> None:
+        self.raw = raw
+
+    @cached_property
+    def header_block(self) -> str:
+        end_of_headers = END_OF_HEADERS.search(self.raw)
+        return self.raw[: end_of_headers.start()] if end_of_headers else self.raw
+
+    @cached_property
+    def headers(self) -> Message:
+        return HeaderParser().parsestr(self.header_block)
+
+    @cached_property
+    def message(self) -> Message:
+        return email.message_from_string(self.raw)
+
+    @cached_property
+    def recipients(self) -> list[Address]:
+        return [Address(*address) for address in getaddresses(self.headers.get_all("To", []))]
+
+    @cached_property
+    def from_(self) -> Address:
+        return Address(*parseaddr(self.headers.get("From", "")))
+
+    @property
+    def to_name(self) -> str:
+        return self.recipients[0].name if self.recipients else ""
+
+    @property
+    def to_address(self) -> str:
+        return self.recipients[0].address if self.recipients else ""
+
+    @property
+    def from_name(self) -> str:
+        return self.from_.name
+
+    @property
+    def from_address(self) -> str:
+        return self.from_.address
+
+    @property
+    def subject(self) -> str:
+        return self.headers["Subject"]
+
+    def body(self, content_type: str) -> str:
+        """The decoded text of the first body part of the given type - or, for a single part email, the body."""
+        if not self.message.is_multipart():
+            return _decode_part(self.message)
+        part = next(
+            (
+                part
+                for part in self.message.walk()
+                if part.get_content_type() == content_type and part.get_content_disposition() != "attachment"
+            ),
+            None,
+        )
+        return _decode_part(part) if part else ""
+
+    @cached_property
+    def attachments(self) -> list[Attachment]:
+        return [
+            Attachment(cast("str", part.get_filename()), part.get_content_type(), _decoded_size(part))
+            for part in self.message.walk()
+            if not part.is_multipart() and (part.get_filename() or part.get_content_disposition() == "attachment")
+        ]
+
+
+def _decode_part(part: Message) -> str:
+    payload = part.get_payload()
+    if isinstance(payload, str) and _transfer_encoding(part) in UNENCODED_TRANSFER_ENCODINGS:
+        # Already text - decoding it to bytes and back would mangle any non-ASCII characters.
+        return payload
+    decoded = cast("bytes", part.get_payload(decode=True))
+    try:
+        return decoded.decode(part.get_content_charset() or MAILBOX_ENCODING, "replace")
+    except LookupError:  # An unknown charset.
+        return decoded.decode(MAILBOX_ENCODING, "replace")
+
+
+def _transfer_encoding(part: Message) -> str:
+    return part.get("Content-Transfer-Encoding", "").strip().lower()
+
+
+def _decoded_size(part: Message) -> int:
+    # Base64's size is calculated from the encoded text, to avoid decoding - and copying - a large attachment.
+    if _transfer_encoding(part) == "base64":
+        encoded = cast("str", part.get_payload())
+        whitespace = sum(encoded.count(c) for c in " \t\r\n")
+        padding = encoded[-8:].count("=")
+        return (len(encoded) - whitespace) * 3 // 4 - padding
+    return len(cast("bytes", part.get_payload(decode=True)))
+
+
+class _StoredEmail(_LazyEmail):
+    """An email in a mailbox, whose header block has been read, but whose full text is only loaded if needed."""
+
+    def __init__(self, header_block: str, load: Callable[[], str]) -> None:
+        self.header_block = header_block
+        self._load = load
+
+    @cached_property
+    def raw(self) -> str:
+        return self._load()
+
+
 def is_email() -> EmailWith:
     """Matches a string as an RFC 822 / MIME email message.
 
@@ -63,35 +211,39 @@ class EmailWith(BaseMatcher[str]):
         self.from_address: Matcher[str] = wrap_matcher(from_address)
         self.subject: Matcher[str] = wrap_matcher(subject)
         self.body_text: Matcher[str] = wrap_matcher(body_text)
+        self.recipients: Matcher[Sequence[Address]] = ANYTHING
+        self.body_type = DEFAULT_BODY_TYPE
+        self.attachments: Matcher[Sequence[Attachment]] = ANYTHING
+        self._parsed: _LazyEmail | None = None
 
     def _matches(self, item: str) -> bool:
-        email = self._parse_email(item)
+        return self._matches_email(self._parse_email(item))
+
+    def _matches_email(self, email: _LazyEmail) -> bool:
         return (
             self.to_name.matches(email.to_name)
             and self.to_address.matches(email.to_address)
             and self.from_name.matches(email.from_name)
             and self.from_address.matches(email.from_address)
+            and self.recipients.matches(email.recipients)
             and self.subject.matches(email.subject)
-            and self.body_text.matches(email.body_text)
+            and (not self._constrains_body or self.body_text.matches(email.body(self.body_type)))
+            and (not self._constrains_attachments or self.attachments.matches(email.attachments))
         )
 
-    @staticmethod
-    def _parse_email(actual_email: str) -> Email:
-        parsed = email.message_from_string(actual_email)
-        # Handle cases where To/From might be missing or malformed gracefully?
-        # Current implementation assumes valid format per regex below.
-        actual_to_name, actual_to_address = cast("Match", re.match("(.*) <(.*)>", parsed["To"])).groups()
-        actual_from_name, actual_from_address = cast("Match", re.match("(.*) <(.*)>", parsed["From"])).groups()
-        actual_subject = parsed["Subject"]
-        actual_body_text = cast("str", parsed.get_payload())
-        return Email(
-            to_name=actual_to_name,
-            to_address=actual_to_address,
-            from_name=actual_from_name,
-            from_address=actual_from_address,
-            subject=actual_subject,
-            body_text=actual_body_text,
-        )
+    @property
+    def _constrains_body(self) -> bool:
+        return not isinstance(self.body_text, IsAnything)
+
+    @property
+    def _constrains_attachments(self) -> bool:
+        return not isinstance(self.attachments, IsAnything)
+
+    def _parse_email(self, actual_email: str) -> _LazyEmail:
+        # Shared by _matches(), describe_mismatch() and describe_match() - fields are parsed once, when first used.
+        if self._parsed is None or self._parsed.raw is not actual_email:
+            self._parsed = _LazyEmail(actual_email)
+        return self._parsed
 
     def describe_to(self, description: Description) -> None:
         description.append_text("email with")
@@ -99,8 +251,10 @@ class EmailWith(BaseMatcher[str]):
         append_matcher_description(self.to_address, "to_address", description)
         append_matcher_description(self.from_name, "from_name", description)
         append_matcher_description(self.from_address, "from_address", description)
+        append_matcher_description(self.recipients, "recipients", description)
         append_matcher_description(self.subject, "subject", description)
         append_matcher_description(self.body_text, "body_text", description)
+        append_matcher_description(self.attachments, "attachments", description)
 
     def describe_mismatch(self, item: str, mismatch_description: Description) -> None:
         email = self._parse_email(item)
@@ -109,8 +263,12 @@ class EmailWith(BaseMatcher[str]):
         describe_field_mismatch(self.to_address, "to_address", email.to_address, mismatch_description)
         describe_field_mismatch(self.from_name, "from_name", email.from_name, mismatch_description)
         describe_field_mismatch(self.from_address, "from_address", email.from_address, mismatch_description)
+        describe_field_mismatch(self.recipients, "recipients", email.recipients, mismatch_description)
         describe_field_mismatch(self.subject, "subject", email.subject, mismatch_description)
-        describe_field_mismatch(self.body_text, "body", email.body_text, mismatch_description)
+        if self._constrains_body:
+            describe_field_mismatch(self.body_text, "body", email.body(self.body_type), mismatch_description)
+        if self._constrains_attachments:
+            describe_field_mismatch(self.attachments, "attachments", email.attachments, mismatch_description)
 
     def describe_match(self, item: str, match_description: Description) -> None:
         email = self._parse_email(item)
@@ -119,8 +277,12 @@ class EmailWith(BaseMatcher[str]):
         describe_field_match(self.to_address, "to_address", email.to_address, match_description)
         describe_field_match(self.from_name, "from_name", email.from_name, match_description)
         describe_field_match(self.from_address, "from_address", email.from_address, match_description)
+        describe_field_match(self.recipients, "recipients", email.recipients, match_description)
         describe_field_match(self.subject, "subject", email.subject, match_description)
-        describe_field_match(self.body_text, "body", email.body_text, match_description)
+        if self._constrains_body:
+            describe_field_match(self.body_text, "body", email.body(self.body_type), match_description)
+        if self._constrains_attachments:
+            describe_field_match(self.attachments, "attachments", email.attachments, match_description)
 
     def with_to_name(self, to_name: str | Matcher[str]):
         """Matches if the email 'To' name matches the given value or matcher.
@@ -198,6 +360,28 @@ class EmailWith(BaseMatcher[str]):
         """
         return self.with_from_address(from_address)
 
+    def with_recipients(self, recipients: Sequence[Address] | Matcher[Sequence[Address]]):
+        """Matches if the email's 'To' recipients match the given value or matcher.
+
+        Each recipient is an :class:`Address`, a ``(name, address)`` named tuple, so for example
+        ``has_item(has_properties(address="simon@brunni.ng"))`` matches an email sent to that address, among others.
+
+        :param recipients: The expected sequence of recipients, or a matcher.
+        :return: Self, for chaining.
+        """
+        self.recipients = wrap_matcher(recipients)
+        return self
+
+    def and_recipients(self, recipients: Sequence[Address] | Matcher[Sequence[Address]]):
+        """Matches if the email's 'To' recipients match the given value or matcher.
+
+        A synonym for :meth:`with_recipients`.
+
+        :param recipients: The expected sequence of recipients, or a matcher.
+        :return: Self, for chaining.
+        """
+        return self.with_recipients(recipients)
+
     def with_subject(self, subject: str | Matcher[str]):
         """Matches if the email subject matches the given value or matcher.
 
@@ -217,24 +401,196 @@ class EmailWith(BaseMatcher[str]):
         """
         return self.with_subject(subject)
 
-    def with_body_text(self, body_text: str | Matcher[str]):
+    def with_body_text(self, body_text: str | Matcher[str], content_type: str = DEFAULT_BODY_TYPE):
         """Matches if the email body text matches the given value or matcher.
 
+        For a multipart email, the body is the first part of the given content type which isn't an attachment - or
+        an empty string if there's no such part. The body is decoded from its transfer encoding and character set.
+
         :param body_text: The expected body string or matcher.
+        :param content_type: The content type of the part to match, for a multipart email.
         :return: Self, for chaining.
         """
         self.body_text = wrap_matcher(body_text)
+        self.body_type = content_type
         return self
 
-    def and_body_text(self, body_text: str | Matcher[str]):
+    def and_body_text(self, body_text: str | Matcher[str], content_type: str = DEFAULT_BODY_TYPE):
         """Matches if the email body text matches the given value or matcher.
 
         A synonym for :meth:`with_body_text`.
 
         :param body_text: The expected body string or matcher.
+        :param content_type: The content type of the part to match, for a multipart email.
+        :return: Self, for chaining.
+        """
+        return self.with_body_text(body_text, content_type)
+
+    def with_attachments(self, attachments: Sequence[Attachment] | Matcher[Sequence[Attachment]]):
+        """Matches if the email's attachments match the given value or matcher.
+
+        Each attachment is an :class:`Attachment`, a ``(filename, content_type, size)`` named tuple. Base64 encoded
+        attachments' sizes are worked out without decoding them.
+
+        :param attachments: The expected sequence of attachments, or a matcher.
+        :return: Self, for chaining.
+        """
+        self.attachments = wrap_matcher(attachments)
+        return self
+
+    def and_attachments(self, attachments: Sequence[Attachment] | Matcher[Sequence[Attachment]]):
+        """Matches if the email's attachments match the given value or matcher.
+
+        A synonym for :meth:`with_attachments`.
+
+        :param attachments: The expected sequence of attachments, or a matcher.
+        :return: Self, for chaining.
+        """
+        return self.with_attachments(attachments)
+
+    def with_attachment(self, filename: str | Matcher[str], size: int | Matcher[int] = ANYTHING):
+        """Matches if the email has an attachment with the given filename and size.
+
+        :param filename: The expected filename or matcher.
+        :param size: The expected decoded size in bytes, or matcher.
         :return: Self, for chaining.
         """
-        return self.with_body_text(body_text)
+        properties: dict[str, Matcher[str] | Matcher[int]] = {
+            "filename": wrap_matcher(filename),
+            "size": wrap_matcher(size),
+        }
+        return self.with_attachments(has_item(has_properties(properties)))
+
+    def and_attachment(self, filename: str | Matcher[str], size: int | Matcher[int] = ANYTHING):
+        """Matches if the email has an attachment with the given filename and size.
+
+        A synonym for :meth:`with_attachment`.
+
+        :param filename: The expected filename or matcher.
+        :param size: The expected decoded size in bytes, or matcher.
+        :return: Self, for chaining.
+        """
+        return self.with_attachment(filename, size)
+
+
+class MailboxHasEmail(BaseMatcher[MailboxSource]):
+    """Matches a mailbox containing at least one email satisfying an email matcher.
+
+    Only each message's headers are read up front. A message's full text is only loaded if the email matcher gets
+    past the header checks and needs the body.
+
+    :param email_matcher: The matcher the email must satisfy, usually built with :func:`is_email`.
+    """
+
+    def __init__(self, email_matcher: Matcher[str]) -> None:
+        self.email_matcher = email_matcher
+        self._message_count: tuple[MailboxSource, int] | None = None
+
+    def _matches(self, item: MailboxSource) -> bool:
+        message_count = 0
+        matched = False
+        with _open_mailbox(item) as emails:
+            for email in emails:
+                message_count += 1
+                if self._email_matches(email):
+                    matched = True
+                    break
+        # Recorded with the mailbox, so describe_mismatch() can tell if it's describing the same one.
+        self._message_count = (item, message_count)
+        return matched
+
+    def _email_matches(self, email: _StoredEmail) -> bool:
+        if isinstance(self.email_matcher, EmailWith):
+            return self.email_matcher._matches_email(email)  # noqa: SLF001
+        return self.email_matcher.matches(email.raw)
+
+    def describe_to(self, description: Description) -> None:
+        description.append_text("mailbox with email matching ").append_description_of(self.email_matcher)
+
+    def describe_mismatch(self, item: MailboxSource, mismatch_description: Description) -> None:
+        if self._message_count is None or self._message_count[0] is not item:
+            self._matches(item)
+        _, message_count = cast("tuple[MailboxSource, int]", self._message_count)
+        mismatch_description.append_text("was mailbox ").append_description_of(item).append_text(
+            f" with {message_count} email(s), none matching"
+        )
+
+
+def mailbox_has_email(email_matcher: Matcher[str]) -> MailboxHasEmail:
+    """Matches a mailbox containing at least one email satisfying an email matcher.
+
+    The mailbox can be a :class:`mailbox.Mailbox` instance (such as :class:`mailbox.mbox` or
+    :class:`mailbox.Maildir`), the path of a Maildir directory, or the path of an mbox file (such as an SMTP sink's
+    capture file). mbox files are memory-mapped, and indexed by scanning for message boundaries.
+
+    For example, ``mailbox_has_email(is_email().with_subject("Welcome").and_to_address("new@example.com"))``.
+
+    :param email_matcher: The matcher the email must satisfy, usually built with :func:`is_email`.
+    :return: A matcher for mailboxes.
+    """
+    return MailboxHasEmail(email_matcher)
+
+
+@contextmanager
+def _open_mailbox(source: MailboxSource) -> Iterator[Iterator[_StoredEmail]]:
+    if isinstance(source, mailbox.Mailbox):
+        yield _mailbox_emails(source)
+    elif Path(source).is_dir():
+        yield _mailbox_emails(mailbox.Maildir(source, factory=None, create=False))
+    else:
+        with Path(source).open("rb") as f:
+            if not os.fstat(f.fileno()).st_size:
+                yield iter(())
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield _mbox_emails(mapped)
+
+
+def _mailbox_emails(box: mailbox.Mailbox) -> Iterator[_StoredEmail]:
+    for key in box.iterkeys():
+        with box.get_file(key) as f:
+            header_block = b"".join(takewhile(bytes.strip, iter(f.readline, b"")))
+        yield _StoredEmail(_decode(header_block), partial(_load_from_mailbox, box, key))
+
+
+def _load_from_mailbox(box: mailbox.Mailbox, key: str) -> str:
+    return _decode(box.get_bytes(key))
+
+
+def _mbox_emails(mapped: mmap.mmap) -> Iterator[_StoredEmail]:
+    offsets = _mbox_message_offsets(mapped)
+    for start, end in zip(offsets, [*offsets[1:], len(mapped)], strict=True):
+        message_start = _skip_from_line(mapped, start, end)
+        end_of_headers = END_OF_MBOX_HEADERS.search(mapped, message_start, end)
+        header_end = end_of_headers.start() if end_of_headers else end
+        yield _StoredEmail(
+            _decode(mapped[message_start:header_end]), partial(_load_from_mmap, mapped, message_start, end)
+        )
+
+
+def _load_from_mmap(mapped: mmap.mmap, start: int, end: int) -> str:
+    return _decode(mapped[start:end])
+
+
+def _decode(raw: bytes) -> str:
+    return raw.decode(MAILBOX_ENCODING, "replace")
+
+
+def _skip_from_line(mapped: mmap.mmap, start: int, end: int) -> int:
+    # A raw capture's first message mightn't have a "From " line.
+    if mapped[start : start + len(MBOX_FROM_LINE)] != MBOX_FROM_LINE:
+        return start
+    return (mapped.find(b"\n", start, end) + 1) or end  # A "From " line without a newline is all there is.
+
+
+def _mbox_message_offsets(mapped: mmap.mmap) -> list[int]:
+    # The first message starts at the beginning of the file, whether or not it has a "From " line.
+    position = mapped.find(MBOX_SEPARATOR)
+    offsets = [] if position == 0 else [0]
+    while position >= 0:
+        offsets.append(position + 1)
+        position = mapped.find(MBOX_SEPARATOR, position + 1)
+    return offsets
 
 
 @deprecated(version="2.3.0", reason="Use builder style is_email()")
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import TYPE_CHECKING, Protocol, TypeVar, runtime_checkable
 
 from deprecated import deprecated
@@ -47,6 +48,8 @@ ANYTHING = anything()
 
 logger = logging.getLogger(__name__)
 
+PARSED_URL_CACHE_SIZE = 4096
+
 
 def is_url() -> UrlWith:
     """Matches a string (or ``furl`` / ``yarl.URL`` object) as a URL.
@@ -92,7 +95,7 @@ class UrlWith(BaseMatcher[U]):
         self.fragment = wrap_matcher(fragment)
 
     def _matches(self, item: U) -> bool:
-        parsed_url = URL(str(item))
+        parsed_url = _parse_url(item)
         return (
             self.scheme.matches(parsed_url.scheme)
             and self.username.matches(parsed_url.user)
@@ -118,7 +121,7 @@ class UrlWith(BaseMatcher[U]):
         append_matcher_description(self.fragment, "fragment", description)
 
     def describe_mismatch(self, item: U, mismatch_description: Description) -> None:
-        parsed_url = URL(str(item))
+        parsed_url = _parse_url(item)
         mismatch_description.append_text("was URL with")
         describe_field_mismatch(self.scheme, "scheme", parsed_url.scheme, mismatch_description)
         describe_field_mismatch(self.username, "username", parsed_url.user, mismatch_description)
@@ -131,7 +134,7 @@ class UrlWith(BaseMatcher[U]):
         describe_field_mismatch(self.fragment, "fragment", parsed_url.fragment, mismatch_description)
 
     def describe_match(self, item: U, match_description: Description) -> None:
-        parsed_url = URL(str(item))
+        parsed_url = _parse_url(item)
         match_description.append_text("was URL with")
         describe_field_match(self.scheme, "scheme", parsed_url.scheme, match_description)
         describe_field_match(self.username, "username", parsed_url.user, match_description)
@@ -321,6 +324,17 @@ class UrlWith(BaseMatcher[U]):
         return self.with_fragment(fragment)
 
 
+def _parse_url(item: UrlProtocol | str) -> URL:
+    if isinstance(item, URL):
+        return item
+    return _parse_url_string(item if isinstance(item, str) else str(item))
+
+
+@lru_cache(maxsize=PARSED_URL_CACHE_SIZE)
+def _parse_url_string(url: str) -> URL:
+    return URL(url)
+
+
 @deprecated(version="2.3.0", reason="Use builder style is_url()")
 def url_with_host(matcher: str | Matcher):  # pragma: no cover
     """Matches URL with specific host.
@@ -1,17 +1,31 @@
 # Copyright 2018-2026 Simon Brunning
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import TYPE_CHECKING, Any
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from hamcrest.core.core.isanything import IsAnything
+from hamcrest.core.string_description import StringDescription
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable, Sequence
+
     from hamcrest.core.description import Description
     from hamcrest.core.matcher import Matcher
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+U = TypeVar("U")
+K = TypeVar("K")
+V = TypeVar("V")
+
+DEFAULT_MAX_CONCURRENCY = 10
+DEFAULT_TIMEOUT = 10.0
+
 
 def append_matcher_description(field_matcher: Matcher[Any], field_name: str, description: Description) -> None:
     if not isinstance(field_matcher, IsAnything):
@@ -38,3 +52,107 @@ def describe_field_match(
     if not isinstance(field_matcher, IsAnything) and field_matcher.matches(actual_value):
         match_description.append_text(f" {field_name}: ")
         field_matcher.describe_match(actual_value, match_description)
+
+
+async def gather_bounded(function: Callable[[T], Awaitable[U]], items: Iterable[T], max_concurrency: int) -> list[U]:
+    """Awaits a function for each of a batch of items concurrently, but no more than ``max_concurrency`` at once.
+
+    :param function: The async function to call for each item.
+    :param items: The items.
+    :param max_concurrency: The maximum number of calls to be awaiting at once.
+    :return: The results, in the same order as the items.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded(item: T) -> U:
+        async with semaphore:
+            return await function(item)
+
+    return await asyncio.gather(*(bounded(item) for item in items))
+
+
+def raise_batch_mismatches(
+    expected: str,
+    items_name: str,
+    total: int,
+    mismatches: Sequence[T],
+    describe_mismatch: Callable[[T, Description], None],
+) -> None:
+    """Raises a single AssertionError reporting every mismatch in a batch, if there are any.
+
+    :param expected: What was expected of every item, e.g. ``"every feed to be ..."``.
+    :param items_name: What the items are, in the plural, e.g. ``"feeds"``.
+    :param total: How many items were checked.
+    :param mismatches: The items which mismatched.
+    :param describe_mismatch: Describes one mismatching item, on its own line of the report.
+    :raises AssertionError: If there are any mismatches.
+    """
+    if mismatches:
+        description = StringDescription()
+        description.append_text(f"\nExpected: {expected}")
+        description.append_text(f"\n     but: {len(mismatches)} of {total} {items_name} mismatched:")
+        for mismatch in mismatches:
+            description.append_text("\n  ")
+            describe_mismatch(mismatch, description)
+        raise AssertionError(str(description))
+
+
+class LruCache(Generic[K, V]):
+    """Least recently used cache, counting hits and misses, for the caches the matcher modules keep.
+
+    What counts as a hit is up to the caller - a cached value may need revalidating first - so lookups aren't counted
+    here, but by :meth:`count_hit` and :meth:`count_miss`. A ``maxsize`` of ``None`` leaves the cache unbounded, and
+    of zero or less disables it. The bookkeeping is locked, so one cache can be used from several threads at once.
+    """
+
+    def __init__(self, maxsize: int | None = None) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        with self._lock:
+            if self.maxsize is None or self.maxsize > 0:
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+                self._evict()
+
+    def discard(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def count_hit(self) -> None:
+        with self._lock:
+            self.hits += 1
+
+    def count_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def resize(self, maxsize: int | None) -> None:
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def clear(self, *, reset_counts: bool = True) -> None:
+        with self._lock:
+            self._entries.clear()
+            if reset_counts:
+                self.hits = self.misses = 0
+
+    def _evict(self) -> None:
+        if self.maxsize is not None:
+            while len(self._entries) > max(self.maxsize, 0):
+                self._entries.popitem(last=False)
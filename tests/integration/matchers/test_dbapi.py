@@ -7,15 +7,23 @@ from hamcrest import (
     contains_exactly,
     contains_inanyorder,
     contains_string,
+    greater_than,
     has_item,
     has_length,
     has_properties,
     has_string,
     matches_regexp,
     not_,
+    starts_with,
 )
 
-from brunns.matchers.dbapi import given_select_returns_rows_matching, has_table, has_table_with_rows
+from brunns.matchers.dbapi import (
+    given_select_returns_rows_matching,
+    has_table,
+    has_table_with_rows,
+    table_has_row_count,
+    table_has_row_where,
+)
 from brunns.matchers.matcher import mismatches_with
 
 logger = logging.getLogger(__name__)
@@ -29,9 +37,45 @@ def test_has_table(db):
         has_table("bacon"),
         mismatches_with(
             db,
-            "SQL statement 'SELECT * FROM bacon;' gives 'OperationalError' <no such table: bacon>",
+            matches_regexp(
+                r"^SQL statement 'SELECT \* FROM bacon WHERE 1 = 0;' gives 'OperationalError' <no such table: bacon> "
+                r"\(after \d+\.\d{3}s\)$"
+            ),
+        ),
+    )
+
+
+def test_table_has_row_count(db):
+    assert_that(db, table_has_row_count("sausages", 3))
+    assert_that(db, table_has_row_count("sausages", greater_than(2)))
+    assert_that(db, not_(table_has_row_count("sausages", 4)))
+    assert_that(db, not_(table_has_row_count("bacon", 0)))
+    assert_that(
+        table_has_row_count("sausages", 4),
+        has_string("DB connection with table 'sausages' with row count matching <4>"),
+    )
+    assert_that(
+        table_has_row_count("sausages", 4),
+        mismatches_with(db, contains_string("property 'row_count' was <3>")),
+    )
+
+
+def test_table_has_row_where(db):
+    assert_that(db, table_has_row_where("sausages", "rating > 5"))
+    assert_that(db, table_has_row_where("sausages", "rating > 5", has_properties(kind="lincolnshire")))
+    assert_that(db, not_(table_has_row_where("sausages", "rating > 10")))
+    assert_that(db, not_(table_has_row_where("sausages", "rating > 5", has_properties(kind="vegetarian"))))
+    assert_that(
+        table_has_row_where("sausages", "rating > 5", has_properties(kind="vegetarian")),
+        has_string(
+            "DB connection with table 'sausages' with row where 'rating > 5' matching "
+            "an object with a property 'kind' matching 'vegetarian'"
         ),
     )
+    assert_that(
+        table_has_row_where("sausages", "rating > 5", has_properties(kind="vegetarian")),
+        mismatches_with(db, all_of(contains_string("kind='cumberland'"), not_(contains_string("rating=0")))),
+    )
 
 
 def test_has_rows(db):
@@ -74,7 +118,11 @@ def test_has_rows(db):
         has_table_with_rows("sausages", has_item(has_properties(kind="vegan"))),
         mismatches_with(
             db,
-            all_of(contains_string("was <["), contains_string("kind='vegetarian', rating=0")),
+            all_of(
+                contains_string("was <["),
+                contains_string("kind='vegetarian', rating=0"),
+                matches_regexp(r"\(3 rows in \d+\.\d{3}s\)$"),
+            ),
         ),
     )
     assert_that(
@@ -84,7 +132,7 @@ def test_has_rows(db):
         ),
         mismatches_with(
             db,
-            "SQL statement 'SELECT * FROM bacon;' gives 'OperationalError' <no such table: bacon>",
+            starts_with("SQL statement 'SELECT * FROM bacon;' gives 'OperationalError' <no such table: bacon> (after "),
         ),
     )
 
@@ -0,0 +1,138 @@
+# Copyright 2018-2026 Simon Brunning
+from hamcrest import (
+    assert_that,
+    contains_exactly,
+    has_item,
+    has_length,
+    has_properties,
+    matches_regexp,
+    not_,
+)
+from hamcrest.core.string_description import StringDescription
+from mockito import mock, verify, when
+
+from brunns.matchers.dbapi import given_select_returns_rows_matching
+from brunns.matchers.matcher import mismatches_with
+
+SELECT = "SELECT * FROM sausages;"
+
+
+def connection_with_rows(*batches):
+    cursor = mock({"description": (("kind", None, None, None, None, None, None),)})
+    when(cursor).execute(SELECT)
+    fetched = iter(batches)
+    when(cursor).fetchmany(2).thenAnswer(lambda _: next(fetched, []))
+    conn = mock()
+    when(conn).cursor().thenReturn(cursor)
+    return conn, cursor
+
+
+def test_streaming_row_matcher_stops_fetching_at_first_match():
+    # Given
+    conn, cursor = connection_with_rows([("cumberland",), ("lincolnshire",)], [("vegetarian",)])
+
+    # When
+
+    # Then
+    assert_that(conn, given_select_returns_rows_matching(SELECT, has_item(has_properties(kind="cumberland")), 2))
+    verify(cursor, times=1).fetchmany(2)
+    verify(cursor, times=1).close()
+
+
+def test_streaming_row_matcher_fetches_every_batch_without_match():
+    # Given
+    conn, cursor = connection_with_rows([("cumberland",), ("lincolnshire",)], [("vegetarian",)])
+
+    # When
+
+    # Then
+    assert_that(conn, not_(given_select_returns_rows_matching(SELECT, has_item(has_properties(kind="vegan")), 2)))
+    verify(cursor, times=3).fetchmany(2)
+    verify(cursor, times=1).close()
+
+
+def test_non_streaming_row_matcher_gets_all_rows():
+    # Given
+    conn, cursor = connection_with_rows([("cumberland",), ("lincolnshire",)], [("vegetarian",)])
+
+    # When
+
+    # Then
+    assert_that(
+        conn,
+        given_select_returns_rows_matching(
+            SELECT,
+            contains_exactly(
+                has_properties(kind="cumberland"),
+                has_properties(kind="lincolnshire"),
+                has_properties(kind="vegetarian"),
+            ),
+            2,
+        ),
+    )
+    verify(cursor, times=3).fetchmany(2)
+
+
+def test_mismatch_described_from_rows_already_fetched():
+    # Given
+    conn, cursor = connection_with_rows([("cumberland",), ("lincolnshire",)], [("vegetarian",)])
+
+    # When
+
+    # Then
+    assert_that(
+        given_select_returns_rows_matching(SELECT, has_length(2), 2),
+        mismatches_with(
+            conn, matches_regexp(r"^was <\[.*'vegetarian'.*\]> with length of <3> \(3 rows in \d+\.\d{3}s\)$")
+        ),
+    )
+    verify(cursor, times=1).execute(SELECT)
+
+
+def test_mismatch_described_rows_capped():
+    # Given
+    conn, _ = connection_with_rows([("cumberland",), ("lincolnshire",)], [("vegetarian",)])
+
+    # When
+
+    # Then
+    assert_that(
+        given_select_returns_rows_matching(SELECT, has_item(has_properties(kind="vegan")), 2, max_described_rows=1),
+        mismatches_with(
+            conn,
+            matches_regexp(r"^was <\[Row\(kind='cumberland'\)\]> \(3 rows in \d+\.\d{3}s, first 1 described\)$"),
+        ),
+    )
+
+
+def test_mismatch_described_from_all_rows_for_non_streaming_matcher():
+    # Given
+    conn, _ = connection_with_rows([("cumberland",), ("lincolnshire",)], [("vegetarian",)])
+
+    # When
+
+    # Then
+    assert_that(
+        given_select_returns_rows_matching(SELECT, has_length(2), 2, max_described_rows=1),
+        mismatches_with(
+            conn, matches_regexp(r"^was <\[.*'vegetarian'.*\]> with length of <3> \(3 rows in \d+\.\d{3}s\)$")
+        ),
+    )
+
+
+def test_mismatch_described_for_connection_not_yet_matched():
+    # Given
+    conn, cursor = connection_with_rows([("cumberland",), ("lincolnshire",)])
+    other_conn, _ = connection_with_rows([("vegetarian",)])
+    matcher = given_select_returns_rows_matching(SELECT, has_length(1), 2)
+    assert_that(other_conn, matcher)
+    description = StringDescription()
+
+    # When
+    matcher.describe_mismatch(conn, description)
+
+    # Then
+    assert_that(
+        str(description), matches_regexp(r"^was <\[.*'lincolnshire'.*\]> with length of <2> \(2 rows in \d+\.\d{3}s\)$")
+    )
+    verify(cursor, times=1).execute(SELECT)
@@ -6,15 +6,22 @@ from hamcrest import (
     assert_that,
     contains_exactly,
     contains_string,
+    equal_to,
     has_entries,
     has_item,
+    has_properties,
     has_string,
     matches_regexp,
     not_,
     starts_with,
 )
+from mockito import mock, verify, when
 
 from brunns.matchers.html import (
+    DEFAULT_DOCUMENT_CACHE_SIZE,
+    TagWith,
+    clear_document_cache,
+    document_cache_info,
     has_attributes,
     has_class,
     has_header_row,
@@ -24,8 +31,11 @@ from brunns.matchers.html import (
     has_link,
     has_named_tag,
     has_row,
+    has_selector,
     has_table,
     has_title,
+    set_document_cache_size,
+    set_parser,
     tag_has_string,
 )
 from brunns.matchers.matcher import mismatches_with
@@ -362,3 +372,100 @@ def test_has_has_image():
             ),
         ),
     )
+
+
+def test_document_cache():
+    clear_document_cache()
+    matcher = all_of(
+        has_title("sausages"),
+        has_table(has_row(cells_match=contains_exactly(tag_has_string("foo"), tag_has_string("bar")))),
+    )
+
+    assert_that(HTML, matcher)
+    assert_that(HTML, matcher)
+
+    assert_that(document_cache_info(), has_properties(hits=3, misses=1, currsize=1))
+
+
+def test_document_cache_size():
+    try:
+        set_document_cache_size(0)
+        clear_document_cache()
+
+        assert_that(HTML, has_title("sausages"))
+        assert_that(HTML, has_title("sausages"))
+        assert_that(HTML, has_table(has_row(index_matches=3)))
+
+        assert_that(document_cache_info(), has_properties(hits=0, misses=3, maxsize=0, currsize=0))
+    finally:
+        set_document_cache_size(DEFAULT_DOCUMENT_CACHE_SIZE)
+
+
+def test_set_parser():
+    try:
+        assert_that(set_parser("lxml"), equal_to("lxml"))
+        assert_that(HTML, has_title("sausages"))
+        assert_that(HTML, has_link(href="https://brunni.ng"))
+        assert_that(
+            HTML,
+            has_table(
+                has_header_row(cells_matcher=contains_exactly(tag_has_string("apples"), tag_has_string("oranges")))
+            ),
+        )
+        assert_that(
+            HTML,
+            has_table(has_row(cells_match=contains_exactly(tag_has_string("fizz"), tag_has_string("buzz")))),
+        )
+        assert_that(HTML, not_(has_title("chips")))
+
+        assert_that(set_parser("no-such-parser", "nor-this"), equal_to("html.parser"))
+        assert_that(HTML, has_title("sausages"))
+    finally:
+        set_parser()
+
+
+def test_html_with_tag_stops_at_first_matching_tag():
+    tag_matcher = mock(spec=TagWith)
+    when(tag_matcher).matches(...).thenReturn(False, True)  # noqa: FBT003
+
+    assert_that(HTML, has_named_tag("td", tag_matcher))
+
+    verify(tag_matcher, times=2).matches(...)
+    assert_that(
+        has_named_tag("td", anything()).iterfind(HTML),
+        has_item(tag_has_string("Adam")),
+    )
+
+
+def test_rows_extracted_once_per_table():
+    table = BeautifulSoup(HTML, "html.parser").table
+    spy = mock(table, strict=False)
+    when(spy).find_all("tr").thenReturn(table.find_all("tr"))
+
+    assert_that(
+        spy, has_row(cells_match=contains_exactly(tag_has_string("baz"), tag_has_string("qux")), index_matches=1)
+    )
+    assert_that(
+        spy, has_header_row(cells_matcher=contains_exactly(tag_has_string("apples"), tag_has_string("oranges")))
+    )
+    assert_that(spy, not_(has_row(index_matches=4)))
+
+    verify(spy, times=1).find_all("tr")
+
+
+def test_has_selector():
+    should_match = has_selector("div#fish.banana > p", "Some text.")
+    should_not_match = has_selector("div.grapes > p", "Other text.")
+
+    assert_that(HTML, should_match)
+    assert_that(HTML, not_(should_not_match))
+    assert_that(HTML, has_selector("tr.eden a[href]"))
+    assert_that(HTML, not_(has_selector("tr.eden img")))
+    assert_that(
+        should_match,
+        has_string(matches_regexp(r"HTML with tag selector='div#fish.banana > p' matching tag with string matching")),
+    )
+    assert_that(
+        should_not_match,
+        mismatches_with(HTML, "got HTML with tag selector='div.grapes > p' values ['<p>Some text.</p>']"),
+    )
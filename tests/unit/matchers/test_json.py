@@ -1,9 +1,10 @@
 # Copyright 2018-2026 Simon Brunning
 import json
 
-from hamcrest import assert_that, contains_exactly, has_string, matches_regexp, not_
+import pytest
+from hamcrest import assert_that, contains_exactly, equal_to, greater_than, has_key, has_string, matches_regexp, not_
 
-from brunns.matchers.data import json_matching
+from brunns.matchers.data import extract_json_paths, json_matching, parse_json_path
 from brunns.matchers.matcher import mismatches_with
 
 
@@ -23,3 +24,163 @@ def test_json_matching():
         mismatches_with("WTF is this?", matches_regexp(r"Got invalid JSON ['<]WTF is this\?['>]")),
     )
     assert_that(json_matching([]), mismatches_with("[1]", "was <[1]>"))
+
+
+def test_json_matching_invalid_json_without_matcher():
+    # Given
+
+    # When
+
+    # Then
+    assert_that("[1, 2, 3]", json_matching())
+    assert_that("WTF is this?", not_(json_matching()))
+
+
+def test_json_matching_path():
+    # Given
+    j = json.dumps({"items": [{"id": 1}, {"id": 2}], "meta": {"total": 2, "next": None}})
+
+    # When
+
+    # Then
+    assert_that(j, json_matching().with_json_path("$.meta.total", 2))
+    assert_that(
+        j, json_matching().with_json_path("$.items[1]['id']", greater_than(1)).and_json_path("$.meta.next", None)
+    )
+    assert_that(j, not_(json_matching().with_json_path("$.meta.total", 3)))
+    assert_that(j, not_(json_matching().with_json_path("$.meta.previous", None)))
+    assert_that(
+        json_matching().with_json_path("$.meta.total", 2),
+        has_string("JSON structure with path '$.meta.total' matching <2>"),
+    )
+    assert_that(
+        json_matching({}).with_json_path("$.meta.total", 3).and_json_path("$.meta.previous", None),
+        mismatches_with(
+            j, matches_regexp(r"^was <\{.*\}>, path '\$\.meta\.total' was <2>, path '\$\.meta\.previous' missing$")
+        ),
+    )
+
+
+def test_json_matching_path_stops_parsing_once_found():
+    # Given
+    j = '{"meta": {"total": 2}, "items": [WTF is this?'
+
+    # When
+
+    # Then
+    assert_that(j, json_matching().with_json_path("$.meta.total", 2))
+    assert_that(j, not_(json_matching().with_json_path("$.items[0]", 2)))
+    assert_that(
+        json_matching().with_json_path("$.items[0]", 2),
+        mismatches_with(j, matches_regexp(r"^Got invalid JSON ")),
+    )
+
+
+def test_extract_json_paths():
+    # Given
+    j = json.dumps({"skipped": [{"a": ']}\\"['}, 1.5e3, True], "wanted": {"x y": [None, [3, 4]]}})
+
+    # When
+    actual = extract_json_paths(j, [parse_json_path("$.wanted['x y'][1]"), parse_json_path("$.missing")])
+
+    # Then
+    assert_that(actual, equal_to({("wanted", "x y", 1): [3, 4]}))
+
+
+def test_extract_json_paths_within_other_paths():
+    # Given
+    j = json.dumps({"meta": {"total": 2, "pages": [1, 2]}, "items": "none"})
+
+    # When
+    actual = extract_json_paths(
+        j,
+        [
+            parse_json_path("$.meta"),
+            parse_json_path("$.meta.total"),
+            parse_json_path("$.meta.pages[1]"),
+            parse_json_path("$.meta.pages.first"),
+            parse_json_path("$.meta.missing"),
+        ],
+    )
+
+    # Then
+    assert_that(
+        actual,
+        equal_to(
+            {
+                ("meta",): {"total": 2, "pages": [1, 2]},
+                ("meta", "total"): 2,
+                ("meta", "pages", 1): 2,
+            }
+        ),
+    )
+    assert_that(
+        j,
+        json_matching(has_key("items")).with_json_path("$.meta", has_key("total")).and_json_path("$.meta.total", 2),
+    )
+    assert_that(
+        json_matching(has_key("items")).with_json_path("$.meta.total", 2).and_json_path("$.meta.pages[0]", 2),
+        mismatches_with(j, "path '$.meta.pages[0]' was <1>"),
+    )
+
+
+def test_extract_json_paths_empty_or_scalar_on_the_way_to_path():
+    # Given
+    j = json.dumps({"a": {}, "b": [], "c": 1, "d": "x"})
+
+    # When
+    actual = extract_json_paths(
+        j, [parse_json_path("$.a.x"), parse_json_path("$.b[0]"), parse_json_path("$.c.x"), parse_json_path("$.d")]
+    )
+
+    # Then
+    assert_that(actual, equal_to({("d",): "x"}))
+
+
+def test_extract_json_paths_malformed_documents():
+    # Given
+    path = [parse_json_path("$.b[1]")]
+
+    # When
+
+    # Then
+    with pytest.raises(ValueError, match="Unterminated JSON container"):
+        extract_json_paths('{"a": [1, {"x": "]"}', path)
+    with pytest.raises(ValueError, match="Expecting ':' at position 5"):
+        extract_json_paths('{"a" 1, "b": [1, 2]}', path)
+    with pytest.raises(ValueError, match="Expecting ',' at position 8"):
+        extract_json_paths('{"a": 1 "b": [1, 2]}', path)
+    with pytest.raises(ValueError, match="Expecting ',' at position 17"):
+        extract_json_paths('{"a": 1, "b": [1 2]}', path)
+    with pytest.raises(ValueError, match="Expecting JSON value at position 6"):
+        extract_json_paths('{"a": , "b": [1, 2]}', path)
+    with pytest.raises(ValueError, match="Expecting value"):
+        extract_json_paths('{"a": 1, "b": [1, nope]}', path)
+    assert_that(
+        json_matching().with_json_path("$.b[1]", 2),
+        mismatches_with('{"b": [1, nope]}', matches_regexp(r"^Got invalid JSON ")),
+    )
+
+
+def test_parse_json_path():
+    # Given
+
+    # When
+
+    # Then
+    assert_that(parse_json_path("$"), equal_to(()))
+    assert_that(parse_json_path("$.meta.total"), equal_to(("meta", "total")))
+    assert_that(parse_json_path("$.items[0]['id']"), equal_to(("items", 0, "id")))
+    assert_that(parse_json_path('$["a.b"][12]'), equal_to(("a.b", 12)))
+
+
+def test_parse_json_path_invalid():
+    # Given
+
+    # When
+
+    # Then
+    with pytest.raises(ValueError, match="must start with"):
+        parse_json_path("meta.total")
+    with pytest.raises(ValueError, match="at position 7"):
+        parse_json_path("$.items[x]")
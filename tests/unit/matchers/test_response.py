@@ -1,14 +1,37 @@
 # Copyright 2018-2026 Simon Brunning
+import asyncio
+import hashlib
+from collections.abc import Iterator
 from datetime import timedelta
 
+import httpx2 as httpx
+import pytest
 from faker import Faker
-from hamcrest import assert_that, contains_exactly, contains_string, has_entries, has_string, not_
-from mockito import mock, when
+from hamcrest import (
+    assert_that,
+    contains_exactly,
+    contains_string,
+    has_entries,
+    has_string,
+    is_,
+    matches_regexp,
+    not_,
+)
+from mockito import mock, verify, when
 from yarl import URL
 
 from brunns.matchers.matcher import matches_with, mismatches_with
 from brunns.matchers.object import between
-from brunns.matchers.response import ResponseProtocol, is_response, redirects_to
+from brunns.matchers.response import (
+    ResponseProtocol,
+    StreamedResponseMatcher,
+    assert_responses,
+    assert_responses_async,
+    assert_that_async,
+    is_response,
+    is_streamed_response,
+    redirects_to,
+)
 from brunns.matchers.url import is_url
 
 fake = Faker()
@@ -307,6 +330,83 @@ def test_response_matcher_invalid_json():
     )
 
 
+def test_response_matcher_reads_body_once_per_assertion():
+    # Given
+    stub_response = mock({"status_code": 200, "text": "sausages"})
+    when(stub_response).json().thenReturn({"a": "b"})
+    matcher = is_response().with_json({"a": "c"})
+
+    # When
+
+    # Then
+    assert_that(matcher, mismatches_with(stub_response, contains_string("was response with json: was <{'a': 'b'}>")))
+    verify(stub_response, times=1).json()
+
+
+def test_response_matcher_checks_status_code_before_decoding_json():
+    # Given
+    stub_response = mock({"status_code": 500, "text": "sausages"})
+    when(stub_response).json().thenReturn({"a": "b"})
+    matcher = is_response().with_json({"a": "b"}).and_status_code(200)
+
+    # When
+
+    # Then
+    assert_that(stub_response, not_(matcher))
+    verify(stub_response, times=0).json()
+    assert_that(matcher, mismatches_with(stub_response, "was response with status code: was <500>"))
+    with pytest.raises(AssertionError, match="but: was response with status code: was <500>"):
+        assert_that(stub_response, matcher)
+    verify(stub_response, times=0).json()
+
+
+def test_response_matcher_decodes_json_to_describe_it_only_if_nothing_cheaper_mismatches():
+    # Given
+    stub_response = mock({"status_code": 200, "text": "sausages", "content": b"sausages"})
+    when(stub_response).json().thenReturn({"a": "b"})
+
+    # When
+
+    # Then
+    assert_that(
+        is_response().with_status_code(200).and_json({"a": "c"}),
+        mismatches_with(stub_response, "was response with json: was <{'a': 'b'}>"),
+    )
+    assert_that(
+        is_response().with_content(b"chips").and_json({"a": "c"}),
+        mismatches_with(stub_response, "was response with content: was <b'sausages'>"),
+    )
+    assert_that(
+        is_response().with_status_code(404).and_body("chips").and_json({"a": "c"}),
+        mismatches_with(stub_response, "was response with status code: was <200> body: was 'sausages'"),
+    )
+    verify(stub_response, times=1).json()
+
+
+def test_response_matcher_json_path():
+    # Given
+    stub_response = mock({"status_code": 200, "text": '{"meta": {"total": 2}, "items": [1, 2]}'})
+    matcher = is_response().with_json_path("$.meta.total", 2).and_json_path("$.items[1]", 3)
+
+    # When
+
+    # Then
+    assert_that(stub_response, is_response().with_json_path("$.meta.total", 2))
+    assert_that(stub_response, not_(matcher))
+    assert_that(
+        matcher,
+        has_string(
+            "response with json paths: JSON structure with path '$.meta.total' matching <2> with path "
+            "'$.items[1]' matching <3>"
+        ),
+    )
+    assert_that(
+        matcher,
+        mismatches_with(stub_response, "was response with json paths: path '$.items[1]' was <2>"),
+    )
+    verify(stub_response, times=0).json()
+
+
 def test_redirect_to():
     # Given
     stub_response = mock(
@@ -386,3 +486,225 @@ def test_response_matcher_builder():
             contains_string("was response with status code: was <200> body: was 'sausages'"),
         ),
     )
+
+
+def streamed(chunks: list[bytes], sent: list[bytes]) -> httpx.Response:
+    def body() -> Iterator[bytes]:
+        for chunk in chunks:
+            sent.append(chunk)
+            yield chunk
+
+    client = httpx.Client(transport=httpx.MockTransport(lambda _: httpx.Response(200, content=body())))
+    return client.send(client.build_request("GET", "http://example.com/download"), stream=True)
+
+
+def test_streamed_response_matcher():
+    # Given
+    chunks = [b"header\n", b"lots of data ", b"spanning chu", b"nks\n", b"footer\n"]
+    body = b"".join(chunks)
+
+    # When
+
+    # Then
+    assert_that(
+        streamed(chunks, []),
+        is_streamed_response()
+        .with_body_containing(b"spanning chunks")
+        .and_body_containing("footer")
+        .and_body_matching(rb"d\w+a")
+        .and_body_length(len(body))
+        .and_body_hash(hashlib.sha256(body).hexdigest()),
+    )
+    assert_that(
+        is_streamed_response().with_body_containing(b"missing").and_body_matching(rb"\d+").and_body_length(99),
+        has_string(r"streamed response with body containing <b'missing'> body matching <b'\\d+'> body length: <99>"),
+    )
+    assert_that(
+        is_streamed_response().with_body_containing(b"missing").and_body_matching(rb"\d+").and_body_length(99),
+        mismatches_with(
+            streamed(chunks, []),
+            r"was streamed response with 43 bytes, not containing <b'missing'>, not matching <b'\\d+'> "
+            "body length: was <43>",
+        ),
+    )
+    assert_that(
+        is_streamed_response().with_body_hash(hashlib.sha512(body).hexdigest(), "sha512"),
+        matches_with(
+            streamed(chunks, []),
+            f"was streamed response with 43 bytes read body sha512: was '{hashlib.sha512(body).hexdigest()}'",
+        ),
+    )
+
+
+def test_streamed_response_matcher_stops_reading_once_found():
+    # Given
+    sent: list[bytes] = []
+    response = streamed([b"one ", b"two ", b"three ", b"four "], sent)
+
+    # When
+
+    # Then
+    assert_that(response, is_streamed_response().with_body_containing(b"two"))
+    assert_that(sent, contains_exactly(b"one ", b"two "))
+    assert_that(response.is_closed, is_(True))
+
+
+def test_streamed_response_matcher_overlap():
+    # Given
+    chunks = [b"spanning chu", b"nks\n", b"footer\n"]
+
+    # When
+
+    # Then
+    assert_that(
+        streamed(chunks, []),
+        StreamedResponseMatcher(max_match_length=1).with_body_containing(b"spanning chunks").and_body_length(23),
+    )
+    assert_that(streamed(chunks, []), StreamedResponseMatcher(max_match_length=8).with_body_matching(rb"chunks"))
+    assert_that(streamed(chunks, []), not_(StreamedResponseMatcher(max_match_length=2).with_body_matching(rb"chunks")))
+    assert_that(streamed(chunks, []), StreamedResponseMatcher(max_match_length=1).with_body_length(23))
+
+
+def test_streamed_response_matcher_hashes_body_only_if_needed(spy2):
+    # Given
+    chunks = [b"spanning chu", b"nks\n", b"footer\n"]
+    spy2(hashlib.new)
+
+    # When
+
+    # Then
+    assert_that(streamed(chunks, []), is_streamed_response().with_body_length(23))
+    verify(hashlib, times=0).new(...)
+    assert_that(
+        streamed(chunks, []),
+        is_streamed_response().with_body_hash(hashlib.sha256(b"".join(chunks)).hexdigest()),
+    )
+    verify(hashlib, times=1).new(...)
+
+
+def test_streamed_requests_response():
+    # Given
+    class RequestsResponse:
+        def iter_content(self, chunk_size: int, decode_unicode: bool = False) -> Iterator[bytes]:  # noqa: FBT001, FBT002, ARG002
+            return iter([b"sau", b"sages"])
+
+    # When
+
+    # Then
+    assert_that(RequestsResponse(), is_streamed_response().with_body_containing(b"sausages"))
+
+
+def json_server() -> httpx.AsyncClient:
+    async def app(scope, _receive, send):
+        status = 200 if scope["path"].startswith("/item") else 404
+        body = f'{{"path": "{scope["path"]}"}}'.encode()
+        await send(
+            {"type": "http.response.start", "status": status, "headers": [(b"content-type", b"application/json")]}
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://api")
+
+
+def test_assert_that_async():
+    async def check():
+        async with json_server() as client:
+            await asyncio.gather(
+                *(
+                    assert_that_async(
+                        client.get(f"/item{i}"), is_response().with_status_code(200).and_json({"path": f"/item{i}"})
+                    )
+                    for i in range(20)
+                )
+            )
+            await assert_that_async(await client.get("/missing"), is_response().with_status_code(404))
+
+            with pytest.raises(AssertionError, match="was response with status code: was <404>"):
+                await assert_that_async(client.get("/missing"), is_response().with_status_code(200), "reason")
+
+    asyncio.run(check())
+
+
+def test_assert_that_async_reads_body_only_if_needed():
+    async def check():
+        async with json_server() as client:
+            response = await client.send(client.build_request("GET", "/item"), stream=True)
+            await assert_that_async(
+                response,
+                is_response().with_status_code(200).and_headers(has_entries({"content-type": "application/json"})),
+            )
+            assert_that(response.is_stream_consumed, is_(False))
+
+            await assert_that_async(response, is_response().with_json({"path": "/item"}))
+            assert_that(response.is_stream_consumed, is_(True))
+
+            response = await client.send(client.build_request("GET", "/item"), stream=True)
+            await assert_that_async(response, not_(redirects_to("http://example.com/elsewhere")))
+            assert_that(response.is_stream_consumed, is_(True))
+
+    asyncio.run(check())
+
+
+def test_assert_that_async_never_reads_sync_response_body():
+    # Given
+    sent: list[bytes] = []
+    response = streamed([b"sausages"], sent)
+
+    # When
+
+    # Then
+    asyncio.run(assert_that_async(response, is_response().with_status_code(200)))
+    assert_that(response.is_stream_consumed, is_(False))
+    with pytest.raises(httpx.ResponseNotRead):
+        asyncio.run(assert_that_async(response, is_response().with_body("sausages")))
+
+    response.read()
+    asyncio.run(assert_that_async(response, is_response().with_body("sausages")))
+
+
+def test_assert_responses_async():
+    async def check():
+        async with json_server() as client:
+            await assert_responses_async(
+                [(f"http://api/item{i}", is_response().with_json({"path": f"/item{i}"})) for i in range(20)]
+                + [(httpx.Request("GET", "http://api/missing"), is_response().with_status_code(404))],
+                max_concurrency=4,
+                client=client,
+            )
+
+    asyncio.run(check())
+
+
+def test_assert_responses_async_reports_all_mismatches():
+    async def check():
+        async with json_server() as client:
+            await assert_responses_async(
+                [
+                    ("http://api/item1", is_response().with_status_code(200)),
+                    ("http://api/missing1", is_response().with_status_code(200)),
+                    ("http://api/item2", is_response().with_json({"path": "/item3"})),
+                ],
+                client=client,
+            )
+
+    with pytest.raises(AssertionError) as e:
+        asyncio.run(check())
+
+    assert_that(
+        str(e.value),
+        matches_regexp(
+            r"^\nExpected: every response to match\n"
+            r"     but: 2 of 3 responses mismatched:\n"
+            r"  GET http://api/missing1 \(latency \d+\.\d{3}s, elapsed \d+\.\d{3}s\): "
+            r"expected response with status code: <200> but was response with status code: was <404>\n"
+            r"  GET http://api/item2 \(latency \d+\.\d{3}s, elapsed \d+\.\d{3}s\): "
+            r"expected response with json: <{'path': '/item3'}> but was response with json: was <{'path': '/item2'}>$"
+        ),
+    )
+
+
+def test_assert_responses_connection_failure():
+    with pytest.raises(AssertionError) as e:
+        assert_responses([("http://127.0.0.1:9/", is_response())], timeout=1.0)
+
+    assert_that(str(e.value), matches_regexp(r"GET http://127.0.0.1:9/ \(latency \d+\.\d{3}s\): HTTP error"))
@@ -1,14 +1,41 @@
 # Copyright 2018-2026 Simon Brunning
+import asyncio
+import threading
 from datetime import datetime, timezone
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
 
 import feedparser
 import httpx2 as httpx
-from hamcrest import anything, assert_that, contains_inanyorder, contains_string, equal_to, has_item, has_string, not_
-from mockito import mock, patch
+import pytest
+from hamcrest import (
+    all_of,
+    anything,
+    assert_that,
+    contains_inanyorder,
+    contains_string,
+    equal_to,
+    has_item,
+    has_properties,
+    has_string,
+    not_,
+)
+from mockito import mock, patch, verify
 from yarl import URL
 
 from brunns.matchers.matcher import matches_with, mismatches_with
-from brunns.matchers.rss import is_rss_category, is_rss_entry, is_rss_feed
+from brunns.matchers.rss import (
+    assert_feeds,
+    assert_feeds_async,
+    clear_feed_cache,
+    disable_feed_cache,
+    enable_feed_cache,
+    feed_cache_info,
+    is_rss_category,
+    is_rss_entry,
+    is_rss_feed,
+)
 
 
 def test_is_rss_feed(rss_string: bytes):
@@ -61,6 +88,47 @@ def test_is_rss_feed(rss_string: bytes):
     )
 
 
+def test_is_rss_feed_from_bytes(rss_string: str):
+    should_match = is_rss_feed().with_title("Test channel")
+    should_not_match = is_rss_feed().with_title("Another channel")
+
+    assert_that(rss_string.encode("utf-8"), should_match)
+    assert_that(rss_string.encode("utf-8"), not_(should_not_match))
+    assert_that(
+        should_not_match, mismatches_with(rss_string.encode("utf-8"), "was RSS feed with title: was 'Test channel'")
+    )
+
+
+def test_is_rss_feed_from_file(rss_string: str, tmp_path: Path):
+    feed_file = tmp_path / "feed.xml"
+    feed_file.write_text(rss_string, encoding="utf-8")
+    empty_file = tmp_path / "empty.xml"
+    empty_file.touch()
+
+    assert_that(feed_file, is_rss_feed().with_title("Test channel"))
+    assert_that(feed_file, not_(is_rss_feed().with_title("Another channel")))
+    assert_that(empty_file, not_(is_rss_feed()))
+
+
+def test_is_rss_feed_parses_once_per_assertion(rss_string: str, spy2):
+    spy2(feedparser.parse)
+    matcher = is_rss_feed().with_title("Another channel")
+
+    assert_that(matcher, mismatches_with(rss_string, "was RSS feed with title: was 'Test channel'"))
+
+    verify(feedparser, times=1).parse(...)
+
+
+def test_is_rss_feed_reparses_for_each_assertion(rss_string: str, spy2):
+    spy2(feedparser.parse)
+    matcher = is_rss_feed().with_title("Test channel")
+
+    assert_that(rss_string, matcher)
+    assert_that(rss_string, matcher)
+
+    verify(feedparser, times=2).parse(...)
+
+
 def test_is_rss_entry():
     entry = feedparser.FeedParserDict(
         {
@@ -355,3 +423,118 @@ def test_is_rss_category():
             category, "was RSS category with text: was 'Category 1' domain: was <https://example.com/category1>"
         ),
     )
+
+
+def feed_server(rss_string: str):
+    async def app(scope, _receive, send):
+        status, body = (200, rss_string.encode("utf-8")) if scope["path"].startswith("/feed") else (404, b"Nope")
+        await send({"type": "http.response.start", "status": status, "headers": [(b"content-type", b"text/xml")]})
+        await send({"type": "http.response.body", "body": body})
+
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app))
+
+
+def test_assert_feeds_async(rss_string: str):
+    async def check():
+        async with feed_server(rss_string) as client:
+            await assert_feeds_async(
+                [f"http://feeds/feed{i}" for i in range(20)],
+                is_rss_feed().with_title("Test channel"),
+                max_concurrency=4,
+                client=client,
+            )
+
+    asyncio.run(check())
+
+
+def test_assert_feeds_async_reports_all_mismatches(rss_string: str):
+    async def check():
+        async with feed_server(rss_string) as client:
+            await assert_feeds_async(
+                ["http://feeds/feed1", "http://feeds/feed2", "http://feeds/missing"],
+                is_rss_feed().with_title("Another channel"),
+                client=client,
+            )
+
+    with pytest.raises(AssertionError) as e:
+        asyncio.run(check())
+
+    assert_that(
+        str(e.value),
+        all_of(
+            contains_string("Expected: every feed to be RSS feed with title: 'Another channel'"),
+            contains_string("but: 3 of 3 feeds mismatched:"),
+            contains_string("http://feeds/feed1: was RSS feed with title: was 'Test channel'"),
+            contains_string("http://feeds/feed2: was RSS feed with title: was 'Test channel'"),
+            contains_string("http://feeds/missing: HTTP error"),
+        ),
+    )
+
+
+def test_assert_feeds_connection_failure():
+    with pytest.raises(AssertionError) as e:
+        assert_feeds(["http://127.0.0.1:9/feed"], timeout=1.0)
+
+    assert_that(str(e.value), contains_string("http://127.0.0.1:9/feed: HTTP error"))
+
+
+@pytest.fixture
+def feed_server_url(rss_string: str):
+    etags: list[str | None] = ['"v1"']
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            etag = etags[-1] if self.path == "/feed" else None
+            if etag and self.headers.get("If-None-Match") == etag:
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                self.end_headers()
+                return
+            body = rss_string.encode("utf-8")
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", "text/xml")
+            if etag:
+                self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield URL(f"http://127.0.0.1:{server.server_address[1]}"), etags
+    server.shutdown()
+    server.server_close()
+
+
+def test_feed_cache(feed_server_url):
+    base_url, etags = feed_server_url
+    feed_url, untagged_feed_url = str(base_url / "feed"), str(base_url / "untagged")
+    enable_feed_cache()
+    try:
+        clear_feed_cache()
+        matcher = is_rss_feed().with_title("Test channel")
+
+        assert_that(feed_url, matcher)
+        assert_that(feed_url, matcher)
+        assert_that(feed_url, not_(is_rss_feed().with_title("Another channel")))
+        assert_that(feed_cache_info(), has_properties(hits=2, misses=1, currsize=1))
+
+        etags.append('"v2"')
+        assert_that(feed_url, matcher)
+        assert_that(feed_url, matcher)
+        assert_that(untagged_feed_url, matcher)
+        assert_that(untagged_feed_url, matcher)
+        assert_that(feed_cache_info(), has_properties(hits=3, misses=4, currsize=1))
+
+        etags.append(None)
+        assert_that(feed_url, matcher)
+        assert_that(feed_url, matcher)
+        assert_that(feed_cache_info(), has_properties(hits=3, misses=6, currsize=0))
+    finally:
+        disable_feed_cache()
+
+    assert_that(feed_url, matcher)
+    assert_that(feed_cache_info(), has_properties(hits=0, misses=0, currsize=0))
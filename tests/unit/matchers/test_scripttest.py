@@ -1,20 +1,49 @@
 # Copyright 2018-2026 Simon Brunning
 """Unit tests for scripttest matchers."""
 
+import asyncio
+import re
+import shlex
+import subprocess
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
 from hamcrest import (
     anything,
     assert_that,
     contains_exactly,
     contains_string,
+    equal_to,
+    greater_than,
     has_entries,
     has_key,
+    has_length,
+    has_properties,
     has_string,
+    is_,
+    matches_regexp,
     not_,
 )
+from hamcrest.core.string_description import StringDescription
 from mockito import mock
 
 from brunns.matchers.matcher import matches_with, mismatches_with
-from brunns.matchers.scripttest import is_proc_result
+from brunns.matchers.scripttest import (
+    DEFAULT_FILE_HASH_CACHE_SIZE,
+    assert_commands,
+    assert_commands_async,
+    clear_file_hash_cache,
+    file_hash_cache_info,
+    from_completed_process,
+    is_output,
+    is_proc_result,
+    run_commands_async,
+    set_file_hash_cache_size,
+    tree_manifest,
+    tree_matches_manifest,
+)
 
 # Create a mock ProcResult for testing
 MOCK_PROC_RESULT = mock(
@@ -279,3 +308,234 @@ def test_proc_result_matcher_and_synonyms():
 
     # Then
     assert_that(proc_result, matcher)
+
+
+def test_output_matcher():
+    # Given
+    output = "starting\nloaded 42 rows\r\nERROR: disk full\nstopping\n"
+
+    # When
+
+    # Then
+    assert_that(output, is_output().with_line("stopping").and_line(contains_string("ERROR")))
+    assert_that(output, is_output().with_line_matching(r"loaded \d+ rows").and_line_count(4))
+    assert_that(output, not_(is_output().with_line("loaded 42")))
+    assert_that("no newline\nat end", is_output().with_line("at end").and_line_count(2))
+    assert_that(
+        is_output().with_line("stopping").and_line_matching("^WARN").and_line_count(greater_than(5)),
+        has_string("output with line: 'stopping' line: a string matching '^WARN' line count: a value greater than <5>"),
+    )
+    assert_that(
+        is_output().with_line("stopping").and_line_matching("^WARN").and_line_count(greater_than(5)),
+        mismatches_with(
+            output,
+            "was output with 4 lines, none matching a string matching '^WARN' line count: was <4>",
+        ),
+    )
+    assert_that(
+        is_output().with_line_matching("^ERROR").and_line_count(4),
+        matches_with(output, "was output with line: was 'ERROR: disk full' line count: was <4>"),
+    )
+
+
+def test_output_matcher_stops_reading_at_first_match():
+    # Given
+    read = []
+
+    def lines() -> Iterator[bytes]:
+        for i in range(1_000_000):
+            read.append(i)
+            yield f"line {i}\n".encode()
+
+    # When
+    output = lines()
+
+    # Then
+    assert_that(output, is_output().with_line("line 9"))
+    assert_that(read, has_length(10))
+
+
+def test_output_matcher_reads_iterator_once():
+    # Given
+    output = iter(["one\n", "two\n"])
+
+    # When
+
+    # Then
+    assert_that(
+        is_output().with_line("three"), mismatches_with(output, "was output with 2 lines, none matching 'three'")
+    )
+
+
+def test_output_matcher_file(tmp_path: Path):
+    # Given
+    log = tmp_path / "etl.log"
+    log.write_text("".join(f"row {i}\n" for i in range(1000)))
+
+    # When
+
+    # Then
+    with log.open() as output:
+        assert_that(output, is_output().with_line("row 999").and_line_count(1000))
+    assert_that(MOCK_PROC_RESULT, is_proc_result().with_stdout(is_output().with_line("test output")))
+
+
+def test_completed_process():
+    # Given
+    process = subprocess.run(
+        [sys.executable, "-c", "import sys; print('out'); sys.exit(3)"], capture_output=True, check=False
+    )
+
+    # When
+    result = from_completed_process(process)
+
+    # Then
+    assert_that(
+        result,
+        is_proc_result()
+        .with_returncode(3)
+        .and_stdout(is_output().with_line("out"))
+        .and_stderr("")
+        .and_args(contains_exactly(sys.executable, "-c", contains_string("print")))
+        .and_files_created({}),
+    )
+    assert_that(
+        from_completed_process(subprocess.CompletedProcess("ls", 0)),
+        is_proc_result().with_args(["ls"]).and_stdout("").and_stderr(""),
+    )
+
+
+def test_run_commands_async():
+    # Given
+    commands = [[sys.executable, "-c", f"print({i})"] for i in range(5)]
+
+    # When
+    results = asyncio.run(run_commands_async(commands, max_concurrency=2))
+
+    # Then
+    assert_that(
+        results,
+        contains_exactly(
+            *(is_proc_result().with_returncode(0).and_stdout(is_output().with_line(str(i))) for i in range(5))
+        ),
+    )
+
+
+def test_assert_commands():
+    # Given
+    good = [sys.executable, "-c", "print('ok')"]
+    bad = [sys.executable, "-c", "raise SystemExit(2)"]
+
+    # When
+
+    # Then
+    assert_commands([good, good])
+    with pytest.raises(AssertionError) as e:
+        assert_commands([good, bad, good, bad], max_concurrency=2)
+    assert_that(
+        str(e.value),
+        contains_string(
+            "Expected: every command's result to be proc result with return code: <0>\n"
+            "     but: 2 of 4 commands mismatched:\n"
+            f"  {shlex.join(bad)}: was proc result with return code: was <2>\n"
+        ),
+    )
+    with pytest.raises(AssertionError, match="1 of 1 commands mismatched"):
+        asyncio.run(assert_commands_async([good], is_proc_result().with_stdout("not ok\n")))
+
+
+def test_assert_commands_reports_commands_which_cannot_run_or_time_out(tmp_path: Path):
+    # Given
+    good = [sys.executable, "-c", "print('ok')"]
+    missing = [str(tmp_path / "no-such-binary")]
+    hung = [sys.executable, "-c", "import time; time.sleep(60)"]
+
+    # When
+    with pytest.raises(AssertionError) as e:
+        assert_commands([good, missing, hung, good], timeout=1)
+
+    # Then
+    assert_that(
+        str(e.value),
+        matches_regexp(
+            r"\n     but: 2 of 4 commands mismatched:\n"
+            rf"  {re.escape(shlex.join(missing))}: FileNotFoundError '.*no-such-binary.*'\n"
+            rf"  {re.escape(shlex.join(hung))}: TimeoutError 'Timed out after 1s'$"
+        ),
+    )
+
+
+def test_tree_matches_manifest(tmp_path: Path):
+    # Given
+    (tmp_path / "src").mkdir()
+    for i in range(20):
+        (tmp_path / "src" / f"module{i}.py").write_text(f"x = {i}\n")
+    manifest = tree_manifest(tmp_path, max_workers=4)
+
+    # When
+    (tmp_path / "src" / "module3.py").write_text("x = 'changed'\n")
+    (tmp_path / "src" / "module5.py").unlink()
+    (tmp_path / "extra.txt").write_text("surprise")
+
+    # Then
+    assert_that(manifest, has_length(20))
+    assert_that(manifest, has_key("src/module0.py"))
+    assert_that(str(tmp_path), not_(tree_matches_manifest(manifest)))
+    assert_that(tree_matches_manifest(manifest), has_string("directory tree matching manifest of 20 files"))
+    assert_that(
+        tree_matches_manifest(manifest),
+        mismatches_with(
+            tmp_path,
+            f"was directory tree <{tmp_path}> with "
+            "missing: <['src/module5.py']> unexpected: <['extra.txt']> changed: <['src/module3.py']>",
+        ),
+    )
+    assert_that(
+        tree_matches_manifest(tree_manifest(tmp_path)),
+        matches_with(tmp_path, f"was directory tree <{tmp_path}> matching manifest of 20 files"),
+    )
+
+
+def test_tree_matches_manifest_rechecks_tree_for_each_match(tmp_path: Path):
+    # Given
+    (tmp_path / "a").write_text("a")
+    (tmp_path / "b").write_text("b")
+    matcher = tree_matches_manifest(tree_manifest(tmp_path))
+
+    # When
+    matched_before = matcher.matches(tmp_path)
+    (tmp_path / "a").write_text("changed")
+
+    # Then
+    assert_that(matched_before, is_(True))
+    assert_that(matcher.matches(tmp_path), is_(False))
+    assert_that(matcher, mismatches_with(tmp_path, f"was directory tree <{tmp_path}> with changed: <['a']>"))
+    description = StringDescription()
+    tree_matches_manifest({"a": "0"}).describe_mismatch(tmp_path, description)
+    assert_that(
+        str(description), equal_to(f"was directory tree <{tmp_path}> with unexpected: <['b']> changed: <['a']>")
+    )
+
+
+def test_tree_matches_manifest_reuses_unchanged_files_digests(tmp_path: Path):
+    # Given
+    for i in range(10):
+        (tmp_path / f"file{i}.txt").write_text(str(i))
+    clear_file_hash_cache()
+
+    # When
+    manifest = tree_manifest(tmp_path)
+    (tmp_path / "file0.txt").write_text("changed")
+
+    # Then
+    assert_that(tmp_path, not_(tree_matches_manifest(manifest)))
+    assert_that(file_hash_cache_info(), has_properties(hits=9, misses=11, currsize=10))
+
+    try:
+        set_file_hash_cache_size(4)
+        assert_that(file_hash_cache_info(), has_properties(maxsize=4, currsize=4))
+        set_file_hash_cache_size(0)
+        assert_that(tmp_path, tree_matches_manifest(tree_manifest(tmp_path)))
+        assert_that(file_hash_cache_info(), has_properties(currsize=0))
+    finally:
+        set_file_hash_cache_size(DEFAULT_FILE_HASH_CACHE_SIZE)
@@ -1,11 +1,27 @@
 # Copyright 2018-2026 Simon Brunning
 import email.message
+import mailbox
 from dataclasses import dataclass, field
+from pathlib import Path
 
-from hamcrest import assert_that, has_string, not_
+from hamcrest import (
+    assert_that,
+    contains_exactly,
+    contains_string,
+    empty,
+    ends_with,
+    has_item,
+    has_length,
+    has_properties,
+    has_string,
+    not_,
+    starts_with,
+)
+from hamcrest.core.string_description import StringDescription
+from mockito import verify
 
 from brunns.matchers.matcher import matches_with, mismatches_with
-from brunns.matchers.smtp import is_email
+from brunns.matchers.smtp import is_email, mailbox_has_email
 
 
 def test_email_matcher():
@@ -50,6 +66,260 @@ def test_email_matcher():
     )
 
 
+def test_email_matcher_recipients():
+    message = email.message.Message()
+    message["To"] = '"Brunning, Simon" <simon@brunni.ng>, fred@beardy.dev'
+    message["From"] = "jenny@example.com"
+    message["Subject"] = "chips"
+    message = message.as_string()
+    should_match = is_email().with_recipients(has_item(has_properties(address="fred@beardy.dev")))
+    should_not_match = is_email().with_recipients(has_item(has_properties(address="jenny@example.com")))
+
+    assert_that(message, should_match)
+    assert_that(message, not_(should_not_match))
+    assert_that(message, is_email().with_to_name("Brunning, Simon").and_to_address("simon@brunni.ng"))
+    assert_that(message, is_email().with_from_name("").and_from_address("jenny@example.com"))
+    assert_that(
+        message,
+        is_email().with_recipients(contains_exactly(("Brunning, Simon", "simon@brunni.ng"), ("", "fred@beardy.dev"))),
+    )
+    assert_that(
+        is_email().with_recipients(has_length(3)),
+        has_string("email with recipients: an object with length of <3>"),
+    )
+    assert_that(
+        is_email().with_recipients(has_length(3)),
+        mismatches_with(
+            message,
+            "was email with recipients: was "
+            "<[Address(name='Brunning, Simon', address='simon@brunni.ng'), "
+            "Address(name='', address='fred@beardy.dev')]> "
+            "with length of <2>",
+        ),
+    )
+    assert_that(
+        is_email().and_recipients(has_length(2)),
+        matches_with(
+            message,
+            "was email with recipients: was "
+            "<[Address(name='Brunning, Simon', address='simon@brunni.ng'), "
+            "Address(name='', address='fred@beardy.dev')]>",
+        ),
+    )
+
+
+def test_email_matcher_without_recipients():
+    message = email.message.Message()
+    message["Subject"] = "chips"
+
+    assert_that(message.as_string(), is_email().with_to_address("").and_recipients(empty()))
+
+
+def test_email_matcher_body_text():
+    message = str(
+        EmailMessageBuilder()
+        .with_to("simon@brunni.ng", "simon")
+        .and_from("fred@beardy.dev", "fred")
+        .and_body_text("bananas")
+    )
+
+    assert_that(message, is_email().with_body_text("bananas"))
+    assert_that(
+        is_email().with_to_name("simon").and_body_text("apples"),
+        mismatches_with(message, "was email with body: was 'bananas'"),
+    )
+    assert_that(
+        is_email().with_to_name("simon").and_body_text("bananas"),
+        matches_with(message, "was email with to_name: was 'simon' body: was 'bananas'"),
+    )
+
+
+def test_email_matcher_multipart_body_text():
+    message = email.message.EmailMessage()
+    message["To"] = "simon@brunni.ng"
+    message.set_content("bananas £1")
+    message.add_alternative("<p>apples</p>", subtype="html")
+
+    assert_that(message.as_string(), is_email().with_body_text("bananas £1\n"))
+    assert_that(message.as_string(), is_email().with_body_text("<p>apples</p>\n", content_type="text/html"))
+    assert_that(
+        is_email().and_body_text("anything", content_type="image/png"),
+        mismatches_with(message.as_string(), "was email with body: was ''"),
+    )
+
+
+def test_email_matcher_non_ascii_body():
+    message = "To: simon@brunni.ng\nSubject: menu\n\nCafé crème\n"
+
+    assert_that(message, is_email().with_body_text("Café crème\n"))
+
+
+def test_email_matcher_unknown_charset():
+    message = email.message.EmailMessage()
+    message["To"] = "simon@brunni.ng"
+    message.set_content("Café crème\n", cte="base64")
+    message.set_param("charset", "bogus")
+
+    assert_that(message.as_string(), is_email().with_body_text("Café crème\n"))
+
+
+def test_email_matcher_attachments():
+    message = email.message.EmailMessage()
+    message["To"] = "simon@brunni.ng"
+    message.set_content("bananas")
+    message.add_attachment(b"\x00" * 1000, maintype="application", subtype="octet-stream", filename="big.bin")
+    message.add_attachment("chips", filename="small.txt")
+
+    assert_that(message.as_string(), is_email().with_body_text("bananas\n").and_attachment("big.bin", 1000))
+    assert_that(message.as_string(), is_email().with_attachment("small.txt"))
+    assert_that(
+        message.as_string(),
+        is_email().with_attachments(
+            contains_exactly(("big.bin", "application/octet-stream", 1000), ("small.txt", "text/plain", 6))
+        ),
+    )
+    assert_that(message.as_string(), not_(is_email().with_attachment("big.bin", 999)))
+    assert_that(
+        is_email().with_attachment("missing.txt"),
+        has_string(contains_string("email with attachments: a sequence containing")),
+    )
+    assert_that(
+        is_email().and_attachments(empty()),
+        mismatches_with(message.as_string(), contains_string("was email with attachments: was <[Attachment(")),
+    )
+    assert_that(
+        is_email().with_attachment("small.txt", 6),
+        matches_with(message.as_string(), contains_string("was email with attachments: was <[Attachment(")),
+    )
+
+
+def test_email_matcher_only_parses_headers_unless_body_needed(spy2):
+    message = str(
+        EmailMessageBuilder()
+        .with_to("simon@brunni.ng", "simon")
+        .and_from("fred@beardy.dev", "fred")
+        .and_subject("chips")
+        .and_body_text("bananas\n" * 1000)
+    ).replace("\n", "\r\n")
+    spy2(email.message_from_string)
+
+    assert_that(message, is_email().with_subject("chips").and_from_address("fred@beardy.dev"))
+    assert_that(is_email().with_subject("fish"), mismatches_with(message, "was email with subject: was 'chips'"))
+    verify(email, times=0).message_from_string(...)
+
+    assert_that(message, is_email().with_subject("chips").and_body_text(starts_with("bananas")))
+    verify(email, times=1).message_from_string(...)
+
+
+def messages(count: int) -> list[str]:
+    return [
+        str(
+            EmailMessageBuilder()
+            .with_to(f"user{i}@brunni.ng", f"user {i}")
+            .and_from("fred@beardy.dev", "fred")
+            .and_subject(f"message {i}")
+            .and_body_text(f"body {i}\n\nFrom here on it's the body.\n")
+        )
+        for i in range(count)
+    ]
+
+
+def test_mailbox_has_email_in_mbox_file(tmp_path: Path):
+    mbox_path = tmp_path / "capture.mbox"
+    box = mailbox.mbox(mbox_path)
+    for message in messages(5):
+        box.add(message)
+    box.flush()
+    should_match = mailbox_has_email(is_email().with_subject("message 3").and_to_address("user3@brunni.ng"))
+    should_not_match = mailbox_has_email(is_email().with_subject("message 3").and_to_address("user4@brunni.ng"))
+
+    assert_that(mbox_path, should_match)
+    assert_that(mbox_path, not_(should_not_match))
+    assert_that(str(mbox_path), mailbox_has_email(is_email().with_body_text(starts_with("body 4\n"))))
+    assert_that(mbox_path, mailbox_has_email(contains_string("Subject: message 0")))
+    assert_that(box, should_match)
+    assert_that(
+        should_match,
+        has_string(
+            "mailbox with email matching email with to_address: 'user3@brunni.ng' subject: 'message 3'",
+        ),
+    )
+    assert_that(
+        should_not_match, mismatches_with(mbox_path, f"was mailbox <{mbox_path}> with 5 email(s), none matching")
+    )
+
+
+def test_mailbox_has_email_in_maildir(tmp_path: Path):
+    box = mailbox.Maildir(tmp_path / "maildir")
+    for message in messages(3):
+        box.add(message)
+
+    assert_that(
+        tmp_path / "maildir",
+        mailbox_has_email(
+            is_email().with_subject("message 1").and_body_text("body 1\n\nFrom here on it's the body.\n")
+        ),
+    )
+    assert_that(tmp_path / "maildir", not_(mailbox_has_email(is_email().with_subject("message 3"))))
+
+
+def test_mailbox_has_email_in_empty_mbox_file(tmp_path: Path):
+    mbox_path = tmp_path / "empty.mbox"
+    mbox_path.touch()
+    matcher = mailbox_has_email(is_email())
+
+    assert_that(mbox_path, not_(matcher))
+    assert_that(matcher, mismatches_with(mbox_path, contains_string("with 0 email(s), none matching")))
+
+
+def capture_message(i: int) -> str:
+    return str(
+        EmailMessageBuilder()
+        .with_to(f"user{i}@brunni.ng", f"user {i}")
+        .and_subject(f"message {i}")
+        .and_body_text(f"body {i}")
+    )
+
+
+def test_mailbox_has_email_in_bare_capture_file(tmp_path: Path):
+    eml_path = tmp_path / "capture.eml"
+    eml_path.write_text(capture_message(0))
+
+    assert_that(eml_path, mailbox_has_email(is_email().with_subject("message 0").and_body_text(starts_with("body 0"))))
+    assert_that(
+        mailbox_has_email(is_email().with_subject("message 1")),
+        mismatches_with(eml_path, f"was mailbox <{eml_path}> with 1 email(s), none matching"),
+    )
+
+
+def test_mailbox_has_email_in_capture_file_with_unseparated_first_message(tmp_path: Path):
+    capture_path = tmp_path / "capture"
+    capture_path.write_text(capture_message(0) + "\nFrom sender@brunni.ng\n" + capture_message(1))
+
+    assert_that(capture_path, mailbox_has_email(is_email().with_subject("message 0")))
+    assert_that(capture_path, mailbox_has_email(is_email().with_subject("message 1")))
+    assert_that(
+        mailbox_has_email(is_email().with_subject("message 2")),
+        mismatches_with(capture_path, contains_string("with 2 email(s), none matching")),
+    )
+
+
+def test_mailbox_has_email_describes_mailbox_it_is_given(tmp_path: Path):
+    small = mailbox.Maildir(tmp_path / "small")
+    for message in messages(2):
+        small.add(message)
+    large = mailbox.Maildir(tmp_path / "large")
+    for message in messages(4):
+        large.add(message)
+    matcher = mailbox_has_email(is_email().with_subject("missing"))
+    description = StringDescription()
+
+    assert_that(small, not_(matcher))
+    matcher.describe_mismatch(large, description)
+
+    assert_that(str(description), ends_with("with 4 email(s), none matching"))
+
+
 @dataclass
 class EmailMessageBuilder:
     to_address: str = field(default="")
@@ -1,6 +1,7 @@
 # Copyright 2018-2026 Simon Brunning
 import logging
 
+import yarl
 from hamcrest import assert_that, contains_exactly, empty, has_entries, has_string, not_
 
 from brunns.matchers.matcher import matches_with, mismatches_with
@@ -47,6 +48,18 @@ def test_url_with_password():
     assert_that(should_match, matches_with(URL, "was URL with password: was 'password'"))
 
 
+def test_url_object():
+    url = yarl.URL(URL)
+    should_match = is_url().with_host("brunni.ng").and_path("/path1/path2/path3")
+    should_not_match = is_url().with_host("example.com")
+
+    assert_that(url, should_match)
+    assert_that(url, not_(should_not_match))
+
+    assert_that(should_not_match, mismatches_with(url, "was URL with host: was 'brunni.ng'"))
+    assert_that(should_match, matches_with(url, "was URL with host: was 'brunni.ng' path: was '/path1/path2/path3'"))
+
+
 def test_url_with_host():
     should_match = is_url().with_host("brunni.ng")
     should_not_match = is_url().with_host("example.com")